@@ -152,6 +152,9 @@ const AGENT_STATUS = {
   ERROR: 'error'
 } as const;
 
+// Scheduling keywords matched against the lowercased message in a single pass
+const SCHEDULING_KEYWORD_PATTERN = /schedule|remind|monitor|track|watch|follow_up|create_task|add_task|queue|defer|later|tomorrow|next week|when|wait/;
+
 // Configuration interface for the refactored agent
 interface DefaultAgentConfig {
   /** Optional agent ID */
@@ -2471,9 +2474,10 @@ Please provide a helpful, contextual response based on this analysis and memory
           let taskDescription = `Task created from user input: ${message}`;
 
           // If this is a message scheduling task, make it explicit that the agent should use the send_message tool
-          if (message.toLowerCase().includes('send') && message.toLowerCase().includes('message') ||
-            message.toLowerCase().includes('deliver') && message.toLowerCase().includes('joke') ||
-            message.toLowerCase().includes('schedule') && message.toLowerCase().includes('chat')) {
+          const lowerMessage = message.toLowerCase();
+          if (lowerMessage.includes('send') && lowerMessage.includes('message') ||
+            lowerMessage.includes('deliver') && lowerMessage.includes('joke') ||
+            lowerMessage.includes('schedule') && lowerMessage.includes('chat')) {
 
             // Extract chat ID from options context first, then try message text if not available
             const contextChatId = options?.chatId;
@@ -3863,15 +3867,8 @@ Please provide a helpful, contextual response based on this analysis and memory
   }
 
   private detectSchedulingRequest(message: string): boolean {
-    // Check for common scheduling keywords
-    const schedulingKeywords = [
-      'schedule', 'remind', 'monitor', 'track', 'watch', 'follow_up',
-      'create_task', 'add_task', 'queue', 'defer', 'later',
-      'tomorrow', 'next week', 'when', 'defer', 'queue', 'wait'
-    ];
-
-    // Check if any of the scheduling keywords are present in the message
-    return schedulingKeywords.some(keyword => message.toLowerCase().includes(keyword));
+    // Check if any of the common scheduling keywords are present in the message
+    return SCHEDULING_KEYWORD_PATTERN.test(message.toLowerCase());
   }
 
   /**
@@ -25,6 +25,37 @@ import {
   OpportunityStatus
 } from '../../../../lib/opportunity';
 
+/**
+ * Legacy status strings mapped to opportunity system statuses.
+ * Both "in progress" and "in_progress" are accepted since agents emit both.
+ */
+const LEGACY_TO_OPPORTUNITY_STATUS: Readonly<Record<string, OpportunityStatus>> = {
+  'pending': OpportunityStatus.PENDING,
+  'in progress': OpportunityStatus.IN_PROGRESS,
+  'in_progress': OpportunityStatus.IN_PROGRESS,
+  'completed': OpportunityStatus.COMPLETED,
+  'failed': OpportunityStatus.FAILED,
+  'expired': OpportunityStatus.EXPIRED
+};
+
+/**
+ * Opportunity system statuses mapped back to legacy status strings
+ */
+const OPPORTUNITY_TO_LEGACY_STATUS: Readonly<Record<string, string>> = {
+  [OpportunityStatus.PENDING]: 'pending',
+  [OpportunityStatus.IN_PROGRESS]: 'in_progress',
+  [OpportunityStatus.COMPLETED]: 'completed',
+  [OpportunityStatus.FAILED]: 'failed',
+  [OpportunityStatus.EXPIRED]: 'expired'
+};
+
+/**
+ * Map a legacy status string to an opportunity system status
+ */
+function toOpportunityStatus(status: string): OpportunityStatus {
+  return LEGACY_TO_OPPORTUNITY_STATUS[status.toLowerCase().trim()] || OpportunityStatus.PENDING;
+}
+
 /**
  * Error class for opportunity identification
  */
@@ -456,15 +487,7 @@ export class DefaultOpportunityIdentifier implements OpportunityIdentifier {
         if (filter?.priority) newFilter.priorities = [filter.priority.toString().toLowerCase()];
         if (filter?.status) {
           // Map the status
-          const statusMap: Record<string, string> = {
-            'pending': OpportunityStatus.PENDING,
-            'in_progress': OpportunityStatus.IN_PROGRESS,
-            'completed': OpportunityStatus.COMPLETED,
-            'failed': OpportunityStatus.FAILED,
-            'expired': OpportunityStatus.EXPIRED
-          };
-          
-          newFilter.statuses = [statusMap[filter.status] || OpportunityStatus.PENDING];
+          newFilter.statuses = [toOpportunityStatus(filter.status)];
         }
         
         // Retrieve opportunities for this agent using the new system
@@ -535,15 +558,6 @@ export class DefaultOpportunityIdentifier implements OpportunityIdentifier {
       'system_optimization': OpportunityType.SYSTEM_OPTIMIZATION
     };
     
-    // Map status
-    const statusMap: Record<string, string> = {
-      [OpportunityStatus.PENDING]: 'pending',
-      [OpportunityStatus.IN_PROGRESS]: 'in_progress',
-      [OpportunityStatus.COMPLETED]: 'completed',
-      [OpportunityStatus.FAILED]: 'failed',
-      [OpportunityStatus.EXPIRED]: 'expired'
-    };
-    
     return {
       id: newOpp.id,
       type: typeMap[newOpp.type] || OpportunityType.TASK_OPTIMIZATION,
@@ -559,7 +573,7 @@ export class DefaultOpportunityIdentifier implements OpportunityIdentifier {
         insights: []
       },
       detectedAt: newOpp.createdAt,
-      status: statusMap[newOpp.status] || 'pending',
+      status: OPPORTUNITY_TO_LEGACY_STATUS[newOpp.status] || 'pending',
       validUntil: newOpp.expiresAt || new Date(Date.now() + 24 * 60 * 60 * 1000),
       confidence: newOpp.metadata?.confidence as number || 0.5
     };
@@ -578,15 +592,7 @@ export class DefaultOpportunityIdentifier implements OpportunityIdentifier {
     if (this.opportunityManager) {
       try {
         // Map legacy status to new status
-        const statusMap: Record<string, OpportunityStatus> = {
-          'pending': OpportunityStatus.PENDING,
-          'in_progress': OpportunityStatus.IN_PROGRESS,
-          'completed': OpportunityStatus.COMPLETED,
-          'failed': OpportunityStatus.FAILED,
-          'expired': OpportunityStatus.EXPIRED
-        };
-        
-        const newStatus = statusMap[status] || OpportunityStatus.PENDING;
+        const newStatus = toOpportunityStatus(status);
         
         // Update status in the new system
         const updated = await this.opportunityManager.updateOpportunityStatus(
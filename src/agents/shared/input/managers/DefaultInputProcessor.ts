@@ -20,6 +20,7 @@ import { InputProcessorConfigSchema } from '../config/InputProcessorConfigSchema
 import { AbstractBaseManager } from '../../base/managers/BaseManager';
 import { ManagerType } from '../../base/managers/ManagerType';
 import { ManagerHealth } from '../../base/managers/ManagerHealth';
+import { PatternCache } from '../../utils/PatternCache';
 
 /**
  * Default implementation of the InputProcessor interface
@@ -28,6 +29,7 @@ export class DefaultInputProcessor extends AbstractBaseManager implements InputP
   protected config: InputProcessorConfig;
   private preprocessors: Map<string, InputPreprocessor> = new Map();
   private history: ProcessedInput[] = [];
+  private patternCache = new PatternCache();
   private configFactory = createConfigFactory(InputProcessorConfigSchema);
   
   /**
@@ -223,35 +225,48 @@ export class DefaultInputProcessor extends AbstractBaseManager implements InputP
     }
     
     if (this.config.preprocessingSteps?.includes('sanitize')) {
+      // Resolve the sanitization config into a flat list of replacements once,
+      // so each input only runs the replacements that actually apply.
+      // updateConfig re-registers preprocessors, so this list never goes stale.
+      const replacements: Array<[RegExp, string]> = [];
+      
+      if (this.config.sanitization?.removeHtml) {
+        // Simple HTML stripping (a real implementation would use a proper HTML sanitizer)
+        replacements.push([/<[^>]*>?/gm, '']);
+      }
+      
+      if (this.config.sanitization?.removeScripts) {
+        // Remove script tags and JS event handlers
+        replacements.push([/<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>/gi, '']);
+        replacements.push([/on\w+="[^"]*"/gi, '']);
+      }
+      
+      // Compile custom sanitization rules
+      this.config.sanitization?.customRules?.forEach(rule => {
+        if (rule.pattern && rule.replacement) {
+          try {
+            const pattern = typeof rule.pattern === 'string' 
+              ? new RegExp(rule.pattern, 'g') 
+              : rule.pattern;
+            replacements.push([pattern, rule.replacement]);
+          } catch (error) {
+            // Skip an invalid rule rather than failing to register the sanitizer
+            console.error(`Skipping invalid sanitization rule pattern: ${rule.pattern}`, error);
+          }
+        }
+      });
+      
       this.registerPreprocessor({
         id: 'sanitize',
         name: 'Content Sanitizer',
         description: 'Sanitizes input content for safety',
         process: async (input: string) => {
-          // Apply sanitization based on config
           let result = input;
           
-          if (this.config.sanitization?.removeHtml) {
-            // Simple HTML stripping (a real implementation would use a proper HTML sanitizer)
-            result = result.replace(/<[^>]*>?/gm, '');
-          }
-          
-          if (this.config.sanitization?.removeScripts) {
-            // Remove script tags and JS event handlers
-            result = result.replace(/<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>/gi, '');
-            result = result.replace(/on\w+="[^"]*"/gi, '');
+          for (const [pattern, replacement] of replacements) {
+            result = result.replace(pattern, replacement);
           }
           
-          // Apply custom sanitization rules
-          this.config.sanitization?.customRules?.forEach(rule => {
-            if (rule.pattern && rule.replacement) {
-              const pattern = typeof rule.pattern === 'string' 
-                ? new RegExp(rule.pattern, 'g') 
-                : rule.pattern;
-              result = result.replace(pattern, rule.replacement);
-            }
-          });
-          
           return result;
         },
         enabled: true,
@@ -491,7 +506,7 @@ export class DefaultInputProcessor extends AbstractBaseManager implements InputP
             
           case 'pattern':
             const patternParams = (rule.params as { pattern: string; message: string }) || { pattern: '', message: '' };
-            if (patternParams.pattern && !new RegExp(patternParams.pattern).test(contentToValidate)) {
+            if (patternParams.pattern && !this.patternCache.get(patternParams.pattern).test(contentToValidate)) {
               result.valid = false;
               result.hasBlockingIssues = true;
               result.issues!.push({
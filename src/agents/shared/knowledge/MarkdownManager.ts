@@ -210,7 +210,8 @@ export class MarkdownManager {
       await fs.mkdir(cacheDir, { recursive: true });
       
       const cache = Object.fromEntries(this.fileCache);
-      await fs.writeFile(this.cacheFilePath, JSON.stringify(cache, null, 2));
+      // The cache is only read back by loadCache, so skip pretty-printing
+      await fs.writeFile(this.cacheFilePath, JSON.stringify(cache));
       this.logFunction('Saved markdown cache', { entries: this.fileCache.size });
     } catch (error) {
       this.logFunction('Error saving cache', { error: String(error) });
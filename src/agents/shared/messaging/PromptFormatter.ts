@@ -472,37 +472,40 @@ export class PromptFormatter {
       return '';
     }
 
-    let result = '## RELEVANT MEMORIES\n\n';
+    // Bucket memories by relevance type in a single pass
+    const criticalMemories: string[] = [];
+    const highMemories: string[] = [];
+    const mediumMemories: string[] = [];
+
+    for (const memory of memories) {
+      switch (memory.relevanceType) {
+        case 'critical':
+          criticalMemories.push(memory.content);
+          break;
+        case 'high':
+          highMemories.push(memory.content);
+          break;
+        case 'medium':
+          mediumMemories.push(memory.content);
+          break;
+      }
+    }
 
-    // Group memories by relevance type
-    const criticalMemories = memories.filter(m => m.relevanceType === 'critical');
-    const highMemories = memories.filter(m => m.relevanceType === 'high');
-    const mediumMemories = memories.filter(m => m.relevanceType === 'medium');
+    let result = '## RELEVANT MEMORIES\n\n';
 
     // Format critical memories first
     if (criticalMemories.length > 0) {
-      result += '### CRITICAL INFORMATION\n';
-      criticalMemories.forEach(memory => {
-        result += `- ${memory.content}\n`;
-      });
-      result += '\n';
+      result += `### CRITICAL INFORMATION\n- ${criticalMemories.join('\n- ')}\n\n`;
     }
 
     // Format high-relevance memories
     if (highMemories.length > 0) {
-      result += '### HIGHLY RELEVANT\n';
-      highMemories.forEach(memory => {
-        result += `- ${memory.content}\n`;
-      });
-      result += '\n';
+      result += `### HIGHLY RELEVANT\n- ${highMemories.join('\n- ')}\n\n`;
     }
 
     // Format medium-relevance memories
     if (mediumMemories.length > 0) {
-      result += '### RELATED CONTEXT\n';
-      mediumMemories.forEach(memory => {
-        result += `- ${memory.content}\n`;
-      });
+      result += `### RELATED CONTEXT\n- ${mediumMemories.join('\n- ')}\n`;
     }
 
     return result;
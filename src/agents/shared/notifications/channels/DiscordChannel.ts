@@ -12,6 +12,93 @@ import { NotificationChannel } from '../interfaces/NotificationManager.interface
 // Declare types but don't import directly
 type GatewayIntentBits = any;
 
+// How long to wait for the gateway to become ready before giving up on a login
+const READY_TIMEOUT_MS = 30000;
+
+/**
+ * A gateway connection shared by every channel instance using the same token
+ */
+interface SharedDiscordClient {
+  client: Client;
+  ready: Promise<boolean>;
+  refCount: number;
+}
+
+// Gateway connections keyed by bot token. Logging in costs a full websocket
+// handshake, so channels reuse one client instead of each opening their own.
+const sharedClients = new Map<string, SharedDiscordClient>();
+
+/**
+ * Get (or start) the shared client for a token and take a reference to it
+ */
+async function acquireSharedClient(token: string): Promise<SharedDiscordClient> {
+  let shared = sharedClients.get(token);
+  
+  if (!shared) {
+    // Dynamically import discord.js to avoid client-side bundling issues
+    const { Client, GatewayIntentBits } = await import('discord.js');
+    
+    // Another caller may have started the client while discord.js was loading
+    shared = sharedClients.get(token);
+    if (!shared) {
+      // The channel only sends messages, so it subscribes to guild events alone;
+      // GuildMessages would stream every message in every guild over the gateway
+      const client = new Client({
+        intents: [
+          GatewayIntentBits.Guilds,
+        ],
+      });
+      
+      const ready = new Promise<boolean>((resolve) => {
+        // Fail the login instead of waiting forever on a gateway that never
+        // becomes ready; the caller then releases (and destroys) the client
+        const timeout = setTimeout(() => {
+          console.error(`Discord client was not ready after ${READY_TIMEOUT_MS}ms`);
+          resolve(false);
+        }, READY_TIMEOUT_MS);
+        
+        // Set up ready event handler
+        client.once('ready', () => {
+          clearTimeout(timeout);
+          console.log('Discord notification channel is ready');
+          resolve(true);
+        });
+        
+        // Log in to Discord
+        client.login(token).catch((error: Error) => {
+          clearTimeout(timeout);
+          console.error('Discord login error:', error);
+          resolve(false);
+        });
+      });
+      
+      shared = { client, ready, refCount: 0 };
+      sharedClients.set(token, shared);
+    }
+  }
+  
+  shared.refCount++;
+  return shared;
+}
+
+/**
+ * Drop a reference to a shared client, destroying it once it is unused
+ */
+async function releaseSharedClient(token: string, client: Client): Promise<void> {
+  const shared = sharedClients.get(token);
+  
+  if (!shared || shared.client !== client) {
+    return;
+  }
+  
+  shared.refCount--;
+  if (shared.refCount <= 0) {
+    sharedClients.delete(token);
+    await client.destroy();
+    console.log('Discord client disconnected');
+  }
+}
+
 /**
  * Discord channel configuration options
  */
@@ -42,6 +129,7 @@ export class DiscordNotificationChannel {
   private username?: string;
   private avatarUrl?: string;
   private ready = false;
+  private targetChannel: TextChannel | null = null;
   
   /**
    * Create a new Discord channel instance
@@ -67,37 +155,28 @@ export class DiscordNotificationChannel {
       return false;
     }
     
-    return new Promise(async (resolve) => {
-      try {
-        // Dynamically import discord.js to avoid client-side bundling issues
-        const { Client, GatewayIntentBits } = await import('discord.js');
-        
-        // Create Discord client
-        this.client = new Client({
-          intents: [
-            GatewayIntentBits.Guilds,
-            GatewayIntentBits.GuildMessages,
-          ],
-        });
-        
-        // Set up ready event handler
-        this.client.once('ready', () => {
-          console.log('Discord notification channel is ready');
-          this.ready = true;
-          resolve(true);
-        });
-        
-        // Log in to Discord
-        this.client.login(this.token).catch((error: Error) => {
-          console.error('Discord login error:', error);
-          resolve(false);
-        });
-      } catch (error: unknown) {
-        const errorMessage = error instanceof Error ? error.message : String(error);
-        console.error('Discord initialization error:', errorMessage);
-        resolve(false);
+    // Already holding a ready client; acquiring again would leak a reference
+    if (this.client && this.ready) {
+      return true;
+    }
+    
+    try {
+      const shared = await acquireSharedClient(this.token);
+      this.client = shared.client;
+      this.ready = await shared.ready;
+      
+      if (!this.ready) {
+        // Let a later initialize retry the login with a fresh client
+        await releaseSharedClient(this.token, shared.client);
+        this.client = null;
       }
-    });
+      
+      return this.ready;
+    } catch (error: unknown) {
+      const errorMessage = error instanceof Error ? error.message : String(error);
+      console.error('Discord initialization error:', errorMessage);
+      return false;
+    }
   }
   
   /**
@@ -129,11 +208,14 @@ export class DiscordNotificationChannel {
         return false;
       }
       
-      // Get the channel
-      const channel = await this.client.channels.fetch(this.channelId);
-      if (!channel || !('send' in channel)) {
-        console.error('Discord channel not found or not a text channel');
-        return false;
+      // Resolve the target channel once; it stays valid for the client's lifetime
+      if (!this.targetChannel) {
+        const channel = await this.client.channels.fetch(this.channelId);
+        if (!channel || !('send' in channel)) {
+          console.error('Discord channel not found or not a text channel');
+          return false;
+        }
+        this.targetChannel = channel as TextChannel;
       }
       
       // Format the message
@@ -148,7 +230,7 @@ export class DiscordNotificationChannel {
       formattedMessage += `**${title}**\n${content}`;
       
       // Send the message (simple string version)
-      await (channel as TextChannel).send(formattedMessage);
+      await this.targetChannel.send(formattedMessage);
       
       // If we have embeds or files, log that they're not supported in this implementation
       if ((options?.embeds && options.embeds.length > 0) || 
@@ -158,6 +240,8 @@ export class DiscordNotificationChannel {
       
       return true;
     } catch (error: unknown) {
+      // Re-resolve the channel next time in case it was deleted or access changed
+      this.targetChannel = null;
       const errorMessage = error instanceof Error ? error.message : String(error);
       console.error('Error sending Discord message:', errorMessage);
       return false;
@@ -177,8 +261,11 @@ export class DiscordNotificationChannel {
     
     try {
       if (this.client) {
-        await this.client.destroy();
-        console.log('Discord client disconnected');
+        const client = this.client;
+        this.client = null;
+        this.ready = false;
+        this.targetChannel = null;
+        await releaseSharedClient(this.token, client);
       }
     } catch (error: unknown) {
       const errorMessage = error instanceof Error ? error.message : String(error);
@@ -8,8 +8,9 @@
 import { DefaultNotificationManager } from '../DefaultNotificationManager';
 import { NotificationChannel, NotificationPriority } from '../interfaces/NotificationManager.interface';
 
-// Cached instance of notification manager
-let discordNotifier: DefaultNotificationManager | null = null;
+// Cached instance of notification manager. The promise is cached so concurrent
+// first calls share one initialization instead of each connecting to Discord.
+let discordNotifier: Promise<DefaultNotificationManager> | null = null;
 
 /**
  * Get Discord notification manager instance
@@ -22,15 +23,33 @@ async function getDiscordNotifier(
   token: string,
   channelId: string
 ): Promise<DefaultNotificationManager> {
-  if (discordNotifier) {
-    return discordNotifier;
+  if (!discordNotifier) {
+    discordNotifier = createDiscordNotifier(token, channelId).catch((error) => {
+      // Allow the next call to retry instead of caching the failure
+      discordNotifier = null;
+      throw error;
+    });
   }
   
+  return discordNotifier;
+}
+
+/**
+ * Create and initialize a notification manager with a Discord channel
+ * 
+ * @param token Discord bot token
+ * @param channelId Discord channel ID
+ * @returns Promise resolving to notification manager
+ */
+async function createDiscordNotifier(
+  token: string,
+  channelId: string
+): Promise<DefaultNotificationManager> {
   // Create new instance
-  discordNotifier = new DefaultNotificationManager();
+  const notifier = new DefaultNotificationManager();
   
   // Initialize with Discord channel
-  await discordNotifier.initialize({
+  await notifier.initialize({
     defaultSenderId: 'system',
     channels: [
       {
@@ -45,7 +64,7 @@ async function getDiscordNotifier(
     ]
   });
   
-  return discordNotifier;
+  return notifier;
 }
 
 /**
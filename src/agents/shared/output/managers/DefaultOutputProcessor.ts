@@ -21,6 +21,7 @@ import { createConfigFactory } from '../../config';
 import { OutputProcessorConfigSchema } from '../config/OutputProcessorConfigSchema';
 import { ManagerType } from '../../base/managers/ManagerType';
 import { ManagerHealth } from '../../base/managers/ManagerHealth';
+import { PatternCache } from '../../utils/PatternCache';
 
 /**
  * Default implementation of the OutputProcessor interface
@@ -29,6 +30,7 @@ export class DefaultOutputProcessor extends AbstractBaseManager implements Outpu
   protected config: OutputProcessorConfig;
   private processorSteps: Map<string, OutputProcessorStep> = new Map();
   private history: ProcessedOutput[] = [];
+  private patternCache = new PatternCache();
   private configFactory = createConfigFactory(OutputProcessorConfigSchema);
   private templates: Map<string, OutputTemplate> = new Map();
   
@@ -832,7 +834,7 @@ export class DefaultOutputProcessor extends AbstractBaseManager implements Outpu
             
           case 'pattern':
             const patternParams = (rule.params as { pattern: string; message: string }) || { pattern: '', message: '' };
-            if (patternParams.pattern && !new RegExp(patternParams.pattern).test(content)) {
+            if (patternParams.pattern && !this.patternCache.get(patternParams.pattern).test(content)) {
               result.valid = false;
               result.hasBlockingIssues = true;
               result.issues.push({
@@ -105,6 +105,9 @@ export class DefaultReflectionManager extends AbstractBaseManager implements Ref
 
   // Storage for reflection strategies
   private reflectionStrategies: Map<string, ReflectionStrategy> = new Map();
+  
+  // Lowercased strategy name -> strategy ID, kept in sync with reflectionStrategies
+  private strategyIdsByName: Map<string, string> = new Map();
 
   /**
    * Create a new DefaultReflectionManager instance
@@ -1641,10 +1644,7 @@ export class DefaultReflectionManager extends AbstractBaseManager implements Ref
     }
     
     // Check for duplicate names
-    const existingStrategy = Array.from(this.reflectionStrategies.values())
-      .find(s => s.name.toLowerCase() === strategy.name.trim().toLowerCase());
-    
-    if (existingStrategy) {
+    if (this.strategyIdsByName.has(strategy.name.trim().toLowerCase())) {
       throw new ReflectionError(`Strategy with name '${strategy.name}' already exists`, 'DUPLICATE_NAME');
     }
     
@@ -1663,6 +1663,7 @@ export class DefaultReflectionManager extends AbstractBaseManager implements Ref
     
     // Store the strategy
     this.reflectionStrategies.set(reflectionStrategy.id, reflectionStrategy);
+    this.strategyIdsByName.set(reflectionStrategy.name.toLowerCase(), reflectionStrategy.id);
     
     console.log(`[${this.managerId}] Registered reflection strategy: ${reflectionStrategy.name} (${reflectionStrategy.id})`);
     
@@ -1721,10 +1722,9 @@ export class DefaultReflectionManager extends AbstractBaseManager implements Ref
     
     // Check for duplicate names (if name is being updated)
     if (updates.name && updates.name.trim().toLowerCase() !== existingStrategy.name.toLowerCase()) {
-      const duplicateStrategy = Array.from(this.reflectionStrategies.values())
-        .find(s => s.id !== strategyId && s.name.toLowerCase() === updates.name!.trim().toLowerCase());
+      const duplicateId = this.strategyIdsByName.get(updates.name.trim().toLowerCase());
       
-      if (duplicateStrategy) {
+      if (duplicateId !== undefined && duplicateId !== strategyId) {
         throw new ReflectionError(`Strategy with name '${updates.name}' already exists`, 'DUPLICATE_NAME');
       }
     }
@@ -1742,6 +1742,10 @@ export class DefaultReflectionManager extends AbstractBaseManager implements Ref
     
     // Store the updated strategy
     this.reflectionStrategies.set(strategyId.trim(), updatedStrategy);
+    if (updatedStrategy.name !== existingStrategy.name) {
+      this.strategyIdsByName.delete(existingStrategy.name.toLowerCase());
+      this.strategyIdsByName.set(updatedStrategy.name.toLowerCase(), updatedStrategy.id);
+    }
     
     console.log(`[${this.managerId}] Updated reflection strategy: ${updatedStrategy.name} (${updatedStrategy.id})`);
     
@@ -406,12 +406,19 @@ export class ExternalWorkflowTool extends BaseTool {
         }
         return value;
       case 'object':
+        // Empty object is the common default - skip the parser for it
+        if (value === '{}') {
+          return {};
+        }
         try {
           return JSON.parse(value);
         } catch {
           return value;
         }
       case 'array':
+        if (value === '[]') {
+          return [];
+        }
         try {
           const parsed = JSON.parse(value);
           return Array.isArray(parsed) ? parsed : [value];
@@ -8,7 +8,7 @@
 
 import { Tool, ToolCategory, ToolExecutionResult } from '../../../../lib/tools/types';
 import { IdGenerator } from '../../../../utils/ulid';
-import { codaIntegration } from '../integrations/coda';
+import { codaIntegration, CodaDoc } from '../integrations/coda';
 import { logger } from '../../../../lib/logging';
 
 /**
@@ -119,6 +119,23 @@ function generateTitleFromContent(content: string, defaultTitle?: string): strin
   return defaultTitle || `Document - ${new Date().toLocaleString()}`;
 }
 
+/**
+ * Lowercased document names, kept for as long as the (cached) doc objects live
+ */
+const lowercaseDocNames = new WeakMap<CodaDoc, string>();
+
+/**
+ * Get a document's lowercased name, computing it at most once per doc object
+ */
+function getLowercaseDocName(doc: CodaDoc): string {
+  let name = lowercaseDocNames.get(doc);
+  if (name === undefined) {
+    name = doc.name.toLowerCase();
+    lowercaseDocNames.set(doc, name);
+  }
+  return name;
+}
+
 /**
  * Enhanced Coda Document Tool - Preserves Chloe's action|title|content pattern
  * 
@@ -835,7 +852,7 @@ export function createEnhancedCodaListTool(): Tool {
         // Apply name filter
         if (params.nameFilter) {
           const filter = params.nameFilter.toLowerCase();
-          docs = docs.filter(doc => doc.name.toLowerCase().includes(filter));
+          docs = docs.filter(doc => getLowercaseDocName(doc).includes(filter));
         }
         
         // Apply sorting
@@ -846,8 +863,8 @@ export function createEnhancedCodaListTool(): Tool {
             
             switch (params.sortBy) {
               case 'name':
-                aValue = a.name.toLowerCase();
-                bValue = b.name.toLowerCase();
+                aValue = getLowercaseDocName(a);
+                bValue = getLowercaseDocName(b);
                 break;
               case 'created':
                 aValue = new Date(a.createdAt || 0);
@@ -858,8 +875,8 @@ export function createEnhancedCodaListTool(): Tool {
                 bValue = new Date(b.updatedAt || 0);
                 break;
               default:
-                aValue = a.name.toLowerCase();
-                bValue = b.name.toLowerCase();
+                aValue = getLowercaseDocName(a);
+                bValue = getLowercaseDocName(b);
             }
             
             let comparison = 0;
@@ -16,6 +16,16 @@ import {
 } from './ApifyManager.interface';
 import { logger } from '../../../../../lib/logging';
 
+/**
+ * Total time to wait for an actor run to finish
+ */
+const RUN_WAIT_TIMEOUT_MS = 150000;
+
+/**
+ * Longest wait the Apify API allows for a single run status request
+ */
+const MAX_WAIT_FOR_FINISH_SECONDS = 60;
+
 /**
  * Custom error class for Apify operations
  */
@@ -221,16 +231,19 @@ export class DefaultApifyManager implements IApifyManager {
       const runData = await runResponse.json();
       const runId = runData.data.id;
       
-      // Wait for the run to finish
+      // Wait for the run to finish. The status request blocks server-side until the
+      // run finishes (or waitForFinish elapses), so we return as soon as it is done
+      // instead of sleeping between polls
       let status = 'RUNNING';
-      let attempts = 0;
-      const maxAttempts = 30;
+      const waitDeadline = Date.now() + RUN_WAIT_TIMEOUT_MS;
       
-      while (status === 'RUNNING' && attempts < maxAttempts) {
-        await new Promise(resolve => setTimeout(resolve, 5000)); // Wait 5 seconds
-        attempts++;
+      while (status === 'RUNNING' && Date.now() < waitDeadline) {
+        const waitForFinish = Math.min(
+          MAX_WAIT_FOR_FINISH_SECONDS,
+          Math.ceil((waitDeadline - Date.now()) / 1000)
+        );
         
-        const statusResponse = await fetch(`${this.baseApiUrl}/actor-runs/${runId}?token=${this.apiToken}`, {
+        const statusResponse = await fetch(`${this.baseApiUrl}/actor-runs/${runId}?token=${this.apiToken}&waitForFinish=${waitForFinish}`, {
           headers: {
             'Content-Type': 'application/json'
           }
@@ -1188,7 +1201,9 @@ export class DefaultApifyManager implements IApifyManager {
       }
       
       const data = await response.json();
-      logger.debug(`Apify Store API response structure: ${JSON.stringify(Object.keys(data), null, 2)}`);
+      if (logger.isDebugEnabled()) {
+        logger.debug(`Apify Store API response structure: ${JSON.stringify(Object.keys(data), null, 2)}`);
+      }
       
       // Check if the response has the expected structure
       if (!data.data || !data.data.items) {
@@ -3,13 +3,28 @@
  * Implementation of the ICodaIntegration interface for Coda document management
  */
 
-import axios, { AxiosInstance } from 'axios';
-import { ICodaIntegration, CodaDoc, ResolvedResource, CodaIntegrationOptions } from './CodaIntegration.interface';
+import axios, { AxiosError, AxiosInstance, InternalAxiosRequestConfig } from 'axios';
+import https from 'https';
+import {
+  ICodaIntegration,
+  CodaDoc,
+  ResolvedResource,
+  CodaIntegrationOptions
+} from './CodaIntegration.interface';
 import { logger } from '../../../../../lib/logging';
 
 // Constants
 const CODA_API_BASE = 'https://coda.io/apis/v1';
 const DEFAULT_TIMEZONE = 'UTC';
+const MAX_SOCKETS = 20;
+const MAX_FREE_SOCKETS = 10;
+const CACHE_TTL_SHORT_MS = 30 * 1000;
+const CACHE_TTL_LONG_MS = 5 * 60 * 1000;
+const MAX_CACHE_ENTRIES = 200;
+const MAX_RETRIES = 5;
+const RETRY_BASE_DELAY_MS = 500;
+const MAX_RETRY_AFTER_MS = 30 * 1000;
+const RETRYABLE_STATUSES = new Set([429, 500, 502, 503, 504]);
 
 /**
  * Default implementation of the ICodaIntegration interface
@@ -19,6 +34,9 @@ export class DefaultCodaIntegration implements ICodaIntegration {
   private readonly folderId?: string;
   private readonly timezone: string;
   private readonly _isEnabled: boolean;
+  private apiClient: AxiosInstance | null = null;
+  private httpsAgent: https.Agent | null = null;
+  private responseCache = new Map<string, { expiresAt: number; data: any }>();
 
   /**
    * Create a new Coda integration instance
@@ -46,18 +64,160 @@ export class DefaultCodaIntegration implements ICodaIntegration {
   }
 
   /**
-   * Get API client with auth headers
+   * Get API client with auth headers.
+   * The client is created lazily and reused so keep-alive connections are
+   * shared across calls instead of re-negotiating TLS on every request.
    * @private
    */
   private getApiClient(): AxiosInstance {
-    return axios.create({
-      baseURL: CODA_API_BASE,
-      headers: {
-        'Authorization': `Bearer ${this.apiKey}`,
-        'Content-Type': 'application/json'
-      },
-      timeout: 10000 // 10 second timeout
-    });
+    if (!this.apiClient) {
+      this.httpsAgent = new https.Agent({
+        keepAlive: true,
+        maxSockets: MAX_SOCKETS,
+        maxFreeSockets: MAX_FREE_SOCKETS
+      });
+      this.apiClient = axios.create({
+        baseURL: CODA_API_BASE,
+        headers: {
+          'Authorization': `Bearer ${this.apiKey}`,
+          'Content-Type': 'application/json'
+        },
+        timeout: 10000, // 10 second timeout
+        httpsAgent: this.httpsAgent
+      });
+
+      // Retry transient failures inside the client so callers never re-run a whole workflow
+      const client = this.apiClient;
+      client.interceptors.response.use(
+        (response) => response,
+        async (error: AxiosError) => {
+          const config = error.config as (InternalAxiosRequestConfig & { retryCount?: number }) | undefined;
+          const delayMs = config ? this.getRetryDelay(error, config.retryCount ?? 0) : null;
+
+          if (!config || delayMs === null) {
+            throw error;
+          }
+
+          config.retryCount = (config.retryCount ?? 0) + 1;
+          logger.warn(`Coda API returned ${error.response?.status}, retrying ${config.method?.toUpperCase()} ${config.url} in ${delayMs}ms (attempt ${config.retryCount}/${MAX_RETRIES})`);
+          await new Promise(resolve => setTimeout(resolve, delayMs));
+          return client.request(config);
+        }
+      );
+    }
+    
+    return this.apiClient;
+  }
+
+  /**
+   * Work out how long to wait before retrying a failed request, or null if it
+   * should not be retried. Honors Retry-After on 429 (capped at
+   * MAX_RETRY_AFTER_MS) and otherwise backs off exponentially. Writes are only
+   * retried on 429, where the request was rejected before being processed:
+   * page updates append content, so a write is never applied twice.
+   * @private
+   */
+  private getRetryDelay(error: AxiosError, retryCount: number): number | null {
+    const status = error.response?.status;
+    const method = error.config?.method?.toLowerCase();
+
+    if (status === undefined || !RETRYABLE_STATUSES.has(status) || retryCount >= MAX_RETRIES) {
+      return null;
+    }
+
+    if (method !== 'get' && status !== 429) {
+      return null;
+    }
+
+    const retryAfter = Number(error.response?.headers?.['retry-after']);
+    if (status === 429 && Number.isFinite(retryAfter) && retryAfter >= 0) {
+      return Math.min(retryAfter * 1000, MAX_RETRY_AFTER_MS);
+    }
+
+    return RETRY_BASE_DELAY_MS * Math.pow(2, retryCount);
+  }
+
+  /**
+   * Release pooled connections. A new client is created on the next request.
+   */
+  close(): void {
+    this.httpsAgent?.destroy();
+    this.httpsAgent = null;
+    this.apiClient = null;
+  }
+
+  /**
+   * GET a near-static resource, reusing the response until ttlMs has passed
+   * @private
+   */
+  private async cachedGet(path: string, ttlMs: number, params?: Record<string, string>): Promise<any> {
+    const key = params ? `${path}?${new URLSearchParams(params).toString()}` : path;
+    const cached = this.responseCache.get(key);
+
+    if (cached && cached.expiresAt > Date.now()) {
+      return cached.data;
+    }
+
+    const response = await this.getApiClient().get(path, { params });
+
+    this.responseCache.delete(key);
+    if (this.responseCache.size >= MAX_CACHE_ENTRIES) {
+      const oldestKey = this.responseCache.keys().next().value;
+      if (oldestKey !== undefined) {
+        this.responseCache.delete(oldestKey);
+      }
+    }
+    this.responseCache.set(key, { expiresAt: Date.now() + ttlMs, data: response.data });
+
+    return response.data;
+  }
+
+  /**
+   * Yield the items of a paginated list endpoint, following nextPageToken
+   * until the listing is exhausted or the caller stops iterating
+   * @private
+   */
+  private async *iterateItems<T>(path: string, ttlMs: number, params?: Record<string, string>): AsyncGenerator<T> {
+    let pageToken: string | undefined;
+
+    do {
+      const data = await this.cachedGet(path, ttlMs, pageToken ? { ...params, pageToken } : params);
+      yield* (data.items || []) as T[];
+      pageToken = data.nextPageToken;
+    } while (pageToken);
+  }
+
+  /**
+   * Collect up to limit items from a paginated list endpoint
+   * @private
+   */
+  private async fetchItems<T>(path: string, ttlMs: number, params?: Record<string, string>, limit = Infinity): Promise<T[]> {
+    const items: T[] = [];
+
+    if (limit <= 0) {
+      return items;
+    }
+
+    for await (const item of this.iterateItems<T>(path, ttlMs, params)) {
+      items.push(item);
+      if (items.length >= limit) {
+        break;
+      }
+    }
+
+    return items;
+  }
+
+  /**
+   * Drop cached responses whose path starts with the given prefix
+   * @private
+   */
+  private invalidateCache(prefix: string): void {
+    for (const key of Array.from(this.responseCache.keys())) {
+      if (key.startsWith(prefix)) {
+        this.responseCache.delete(key);
+      }
+    }
   }
 
   /**
@@ -106,13 +266,10 @@ export class DefaultCodaIntegration implements ICodaIntegration {
     this.verifyEnabled('resolve browser link');
 
     try {
-      const client = this.getApiClient();
-      const response = await client.get('/resolveBrowserLink', {
-        params: { url }
-      });
+      const data = await this.cachedGet('/resolveBrowserLink', CACHE_TTL_LONG_MS, { url });
       
-      logger.info(`Successfully resolved browser link ${url} to resource ${response.data.resource.id}`);
-      return response.data.resource;
+      logger.info(`Successfully resolved browser link ${url} to resource ${data.resource.id}`);
+      return data.resource;
     } catch (error) {
       const errorMessage = this.formatErrorMessage('resolve browser link', error);
       logger.error(`Error resolving browser link ${url}: ${errorMessage}`);
@@ -130,11 +287,10 @@ export class DefaultCodaIntegration implements ICodaIntegration {
     }
 
     try {
-      const client = this.getApiClient();
-      const response = await client.get('/docs');
+      const docs = await this.fetchItems<CodaDoc>('/docs', CACHE_TTL_SHORT_MS);
       
-      logger.info(`Retrieved ${response.data.items.length} Coda docs`);
-      return response.data.items;
+      logger.info(`Retrieved ${docs.length} Coda docs`);
+      return docs;
     } catch (error) {
       const errorMessage = this.formatErrorMessage('list Coda docs', error);
       logger.error(`Error listing Coda docs: ${errorMessage}`);
@@ -187,32 +343,31 @@ export class DefaultCodaIntegration implements ICodaIntegration {
     const client = this.getApiClient();
     
     // Get the list of pages in the doc
-    const pagesResponse = await client.get(`/docs/${cleanDocId}/pages`);
-    const pages = pagesResponse.data.items;
+    const pages = await this.fetchItems<{ id: string; name: string }>(`/docs/${cleanDocId}/pages`, CACHE_TTL_SHORT_MS);
     
     if (!pages || pages.length === 0) {
       logger.warn(`No pages found in document ${cleanDocId}`);
       return '';
     }
     
-    let fullContent = '';
-    
-    // For each page, get the content as text
-    for (const page of pages) {
+    // Fetch every page's text concurrently over the pooled connections;
+    // sections are joined in page order once all requests settle
+    const sections = await Promise.all(pages.map(async page => {
       try {
         const contentResponse = await client.get(`/docs/${cleanDocId}/pages/${page.id}/content`, {
           params: { format: 'text' }
         });
         
-        fullContent += `# ${page.name}\n\n${contentResponse.data.content || ''}\n\n`;
+        return `# ${page.name}\n\n${contentResponse.data.content || ''}\n\n`;
       } catch (pageError) {
         logger.warn(`Could not read content from page ${page.id} in document ${cleanDocId}: ${pageError instanceof Error ? pageError.message : 'Unknown error'}`);
         // Continue with other pages despite this error
+        return '';
       }
-    }
+    }));
     
     logger.info(`Successfully read content from ${pages.length} pages in document ${cleanDocId}`);
-    return fullContent;
+    return sections.join('');
   }
 
   /**
@@ -252,6 +407,7 @@ export class DefaultCodaIntegration implements ICodaIntegration {
         const createResponse = await client.post('/docs', JSON.stringify(requestBody));
         
         const createdDoc = createResponse.data;
+        this.invalidateCache('/docs');
         logger.info(`Successfully created Coda doc "${title}" with ID ${createdDoc.id}`);
         
         return createdDoc;
@@ -286,6 +442,7 @@ export class DefaultCodaIntegration implements ICodaIntegration {
         await this.updateDocumentContent(docId, content);
       }
       
+      this.invalidateCache(isPage ? '/docs' : `/docs/${this.cleanDocId(docId)}`);
       logger.info(`Successfully updated content for ${isPage ? 'page' : 'doc'} ${docId}`);
     } catch (error) {
       const errorMessage = this.formatErrorMessage('update document', error);
@@ -321,13 +478,12 @@ export class DefaultCodaIntegration implements ICodaIntegration {
     const client = this.getApiClient();
     
     // Find the main page and update its content
-    const pagesResponse = await client.get(`/docs/${cleanDocId}/pages`);
+    const [mainPage] = await this.fetchItems<{ id: string }>(`/docs/${cleanDocId}/pages`, CACHE_TTL_SHORT_MS, undefined, 1);
     
-    if (!pagesResponse.data.items || pagesResponse.data.items.length === 0) {
+    if (!mainPage) {
       throw new Error(`No pages found in document ${cleanDocId}`);
     }
     
-    const mainPage = pagesResponse.data.items[0];
     logger.info(`Found main page with ID ${mainPage.id}, updating content...`);
     
     // Format the payload according to Coda API requirements
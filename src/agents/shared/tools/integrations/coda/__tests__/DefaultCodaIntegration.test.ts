@@ -0,0 +1,107 @@
+/**
+ * DefaultCodaIntegration.test.ts - Tests for the Coda API client retry policy
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import axios from 'axios';
+import { DefaultCodaIntegration } from '../DefaultCodaIntegration';
+
+// Mock the logger
+vi.mock('../../../../../../lib/logging', () => ({
+  logger: {
+    info: vi.fn(),
+    warn: vi.fn(),
+    error: vi.fn(),
+  },
+}));
+
+// Mock axios
+vi.mock('axios');
+const mockedAxios = axios as unknown as { create: ReturnType<typeof vi.fn> };
+
+type ErrorHandler = (error: unknown) => Promise<unknown>;
+
+/**
+ * Build an axios-style error for the given request config and status
+ */
+function createError(config: Record<string, unknown>, status: number, headers: Record<string, string> = {}) {
+  return Object.assign(new Error(`Request failed with status code ${status}`), {
+    config,
+    response: { status, headers, data: {} }
+  });
+}
+
+describe('DefaultCodaIntegration', () => {
+  let mockAxiosInstance: any;
+  let handleError: ErrorHandler;
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    vi.useFakeTimers();
+
+    mockAxiosInstance = {
+      get: vi.fn(),
+      post: vi.fn(),
+      request: vi.fn(),
+      interceptors: {
+        response: {
+          use: vi.fn()
+        }
+      }
+    };
+    mockedAxios.create = vi.fn().mockReturnValue(mockAxiosInstance);
+
+    const integration = new DefaultCodaIntegration({ apiKey: 'test-api-key' });
+    integration['getApiClient']();
+    handleError = mockAxiosInstance.interceptors.response.use.mock.calls[0][1];
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  describe('retry interceptor', () => {
+    it('should not retry a POST that fails with 503', async () => {
+      const error = createError({ method: 'post', url: '/docs' }, 503);
+
+      await expect(handleError(error)).rejects.toBe(error);
+      expect(mockAxiosInstance.request).not.toHaveBeenCalled();
+    });
+
+    it('should retry a POST that fails with 429', async () => {
+      mockAxiosInstance.request.mockResolvedValue({ status: 202, data: {} });
+      const config = { method: 'post', url: '/docs' };
+
+      const result = handleError(createError(config, 429, { 'retry-after': '1' }));
+      await vi.runAllTimersAsync();
+
+      await expect(result).resolves.toEqual({ status: 202, data: {} });
+      expect(mockAxiosInstance.request).toHaveBeenCalledWith(config);
+    });
+
+    it('should retry a GET on 503 and give up after MAX_RETRIES attempts', async () => {
+      // Every retry fails again and goes back through the interceptor
+      mockAxiosInstance.request.mockImplementation((config: Record<string, unknown>) =>
+        handleError(createError(config, 503))
+      );
+
+      const outcome = expect(handleError(createError({ method: 'get', url: '/docs' }, 503)))
+        .rejects.toMatchObject({ response: { status: 503 } });
+      await vi.runAllTimersAsync();
+      await outcome;
+
+      expect(mockAxiosInstance.request).toHaveBeenCalledTimes(5);
+    });
+
+    it('should cap a large Retry-After at 30 seconds', async () => {
+      const setTimeoutSpy = vi.spyOn(globalThis, 'setTimeout');
+      mockAxiosInstance.request.mockResolvedValue({ status: 200, data: {} });
+
+      const result = handleError(createError({ method: 'get', url: '/docs' }, 429, { 'retry-after': '3600' }));
+      await vi.runAllTimersAsync();
+      await result;
+
+      expect(setTimeoutSpy).toHaveBeenCalledWith(expect.any(Function), 30 * 1000);
+    });
+  });
+});
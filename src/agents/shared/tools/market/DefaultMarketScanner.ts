@@ -21,13 +21,12 @@ import {
   MarketScanResult
 } from './MarketScanner.interface';
 
-import { ISourceManager } from './interfaces/MarketSource.interface';
+import { ISourceManager, RssSource } from './interfaces/MarketSource.interface';
 import { ITrendAnalyzer } from './interfaces/TrendAnalysis.interface';
 import { DefaultSourceManager } from './processors/DefaultSourceManager';
 import { DefaultTrendAnalyzer } from './analysis/DefaultTrendAnalyzer';
 import { DefaultRssProcessor } from './processors/rss/DefaultRssProcessor';
 import { ISourceProcessor, IRssProcessor } from './interfaces/SourceProcessor.interface';
-import { RssSource } from './interfaces/MarketSource.interface';
 
 // Import our DefaultApifyManager
 import defaultApifyManager, { IApifyManager } from '../integrations/apify';
@@ -150,18 +149,16 @@ export class DefaultMarketScanner implements IMarketScanner {
       
       logger.info(`Found ${filteredSources.length} sources due for refresh`);
       
-      // Process each source and collect signals
-      const allSignals: MarketSignal[] = [];
-      
-      for (const source of filteredSources) {
+      // Process sources concurrently so the scan takes as long as the slowest
+      // source rather than the sum of all of them
+      const sourceSignals = await Promise.all(filteredSources.map(async source => {
+        let signals: MarketSignal[] = [];
         try {
           // Process the source to get signals
-          const signals = await this.processSource(source);
+          signals = await this.processSource(source);
           
           if (signals.length > 0) {
             logger.info(`Processed ${source.id} (${source.type}) and found ${signals.length} signals`);
-            allSignals.push(...signals);
-            scanCount += signals.length;
             
             // Update the last_checked timestamp
             await this.sourceManager.updateSourceTimestamp(source.id);
@@ -171,6 +168,14 @@ export class DefaultMarketScanner implements IMarketScanner {
         } catch (error) {
           logger.error(`Error processing source ${source.id}:`, error);
         }
+        return signals;
+      }));
+      
+      // Collect signals in source order
+      const allSignals: MarketSignal[] = [];
+      for (const signals of sourceSignals) {
+        allSignals.push(...signals);
+        scanCount += signals.length;
       }
       
       // Analyze signals to find trends if we have enough signals
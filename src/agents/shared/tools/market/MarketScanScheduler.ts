@@ -5,10 +5,11 @@
  * using the system's task scheduler.
  */
 
+import fs from 'fs/promises';
+import path from 'path';
 import { v4 as uuidv4 } from 'uuid';
 import { logger } from '../../../../lib/logging';
-import { IMarketScanner } from './MarketScanner.interface';
-import { MarketTrend } from './MarketScanner.interface';
+import { IMarketScanner, MarketTrend } from './MarketScanner.interface';
 import { ModularSchedulerManager } from '../../../../lib/scheduler/implementations/ModularSchedulerManager';
 import { MarketScanCommand } from './MarketScannerNLP';
 import { Task, TaskPriority, TaskStatus, TaskScheduleType, taskPriorityToNumber } from '../../../../lib/scheduler/models/Task.model';
@@ -267,10 +268,6 @@ export class MarketScanScheduler {
    */
   private async loadScheduledScans(): Promise<void> {
     try {
-      // Use dynamic import to load the fs module
-      const fs = await import('fs/promises');
-      const path = await import('path');
-      
       // Ensure the directory exists
       const dir = path.dirname(this.datastorePath);
       await fs.mkdir(dir, { recursive: true });
@@ -310,10 +307,6 @@ export class MarketScanScheduler {
    */
   private async saveScheduledScans(): Promise<void> {
     try {
-      // Use dynamic import to load the fs module
-      const fs = await import('fs/promises');
-      const path = await import('path');
-      
       // Ensure the directory exists
       const dir = path.dirname(this.datastorePath);
       await fs.mkdir(dir, { recursive: true });
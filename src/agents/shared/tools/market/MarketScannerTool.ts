@@ -88,16 +88,18 @@ export class MarketScannerTool extends StructuredTool {
     }
     
     // Format the trends into a readable response
-    let response = `Found ${trends.length} market trends${command.category ? ` for category '${command.category}'` : ''}:\n\n`;
+    const lines = [`Found ${trends.length} market trends${command.category ? ` for category '${command.category}'` : ''}:\n\n`];
     
     trends.forEach((trend, index) => {
-      response += `${index + 1}. ${trend.name} (Score: ${trend.score}/100)\n`;
-      response += `   ${trend.description}\n`;
-      response += `   Category: ${trend.category}, Stage: ${trend.stage}\n`;
-      response += `   Keywords: ${trend.keywords.join(', ')}\n\n`;
+      lines.push(
+        `${index + 1}. ${trend.name} (Score: ${trend.score}/100)\n` +
+        `   ${trend.description}\n` +
+        `   Category: ${trend.category}, Stage: ${trend.stage}\n` +
+        `   Keywords: ${trend.keywords.join(', ')}\n\n`
+      );
     });
     
-    return response;
+    return lines.join('');
   }
 
   /**
@@ -135,13 +137,13 @@ export class MarketScannerTool extends StructuredTool {
         return "There are no scheduled market scans to cancel.";
       }
       
-      let response = "Which scheduled scan would you like to cancel? Here are the currently scheduled scans:\n\n";
+      const lines = ["Which scheduled scan would you like to cancel? Here are the currently scheduled scans:\n\n"];
       
       scans.forEach(scan => {
-        response += `ID: ${scan.id} - ${scan.description} ${scan.humanReadable}\n`;
+        lines.push(`ID: ${scan.id} - ${scan.description} ${scan.humanReadable}\n`);
       });
       
-      return response;
+      return lines.join('');
     }
     
     // Cancel the specified scan
@@ -166,18 +168,17 @@ export class MarketScannerTool extends StructuredTool {
       return "There are no scheduled market scans.";
     }
     
-    let response = `There ${scans.length === 1 ? 'is' : 'are'} ${scans.length} scheduled market scan${scans.length === 1 ? '' : 's'}:\n\n`;
+    const lines = [`There ${scans.length === 1 ? 'is' : 'are'} ${scans.length} scheduled market scan${scans.length === 1 ? '' : 's'}:\n\n`];
     
     scans.forEach(scan => {
-      response += `ID: ${scan.id} - ${scan.description}\n`;
-      response += `  Schedule: ${scan.humanReadable}\n`;
-      if (scan.category) response += `  Category: ${scan.category}\n`;
-      if (scan.lastRun) response += `  Last Run: ${scan.lastRun.toLocaleString()}\n`;
-      if (scan.nextRun) response += `  Next Run: ${scan.nextRun.toLocaleString()}\n`;
-      response += '\n';
+      lines.push(`ID: ${scan.id} - ${scan.description}\n  Schedule: ${scan.humanReadable}\n`);
+      if (scan.category) lines.push(`  Category: ${scan.category}\n`);
+      if (scan.lastRun) lines.push(`  Last Run: ${scan.lastRun.toLocaleString()}\n`);
+      if (scan.nextRun) lines.push(`  Next Run: ${scan.nextRun.toLocaleString()}\n`);
+      lines.push('\n');
     });
     
-    return response;
+    return lines.join('');
   }
 
   /**
@@ -204,43 +205,46 @@ export class MarketScannerTool extends StructuredTool {
     });
     
     // Create summary
-    let summary = `# Market Trend Summary\n\n`;
-    summary += `Based on the latest market data, here are the most significant trends:\n\n`;
+    const sections = [
+      `# Market Trend Summary\n\n`,
+      `Based on the latest market data, here are the most significant trends:\n\n`
+    ];
     
     // Add trends by category
     for (const [category, categoryTrends] of Object.entries(trendsByCategory)) {
-      summary += `## ${category.toUpperCase()}\n\n`;
+      sections.push(`## ${category.toUpperCase()}\n\n`);
       
       // Sort by score (highest first)
       categoryTrends.sort((a, b) => b.score - a.score);
       
       // Add top trends
       categoryTrends.slice(0, 3).forEach(trend => {
-        summary += `### ${trend.name} (Score: ${trend.score}/100)\n`;
-        summary += `${trend.description}\n\n`;
+        sections.push(`### ${trend.name} (Score: ${trend.score}/100)\n${trend.description}\n\n`);
         
         // Add business impact if high
         if (trend.estimatedBusinessImpact > 70) {
-          summary += `**Business Impact**: High potential (${trend.estimatedBusinessImpact}/100)\n\n`;
+          sections.push(`**Business Impact**: High potential (${trend.estimatedBusinessImpact}/100)\n\n`);
         }
         
         // Add stage
-        summary += `**Stage**: ${trend.stage}\n\n`;
+        sections.push(`**Stage**: ${trend.stage}\n\n`);
         
         // Add relevant user needs
         if (trend.relevantUserNeeds && trend.relevantUserNeeds.length > 0) {
-          summary += `**Addresses User Needs**: ${trend.relevantUserNeeds.join(', ')}\n\n`;
+          sections.push(`**Addresses User Needs**: ${trend.relevantUserNeeds.join(', ')}\n\n`);
         }
       });
     }
     
     // Add total trends count
-    summary += `\n## Overview\n\n`;
-    summary += `Total trends analyzed: ${trends.length}\n`;
-    summary += `Categories: ${Object.keys(trendsByCategory).join(', ')}\n`;
-    summary += `Average trend score: ${Math.round(trends.reduce((sum, t) => sum + t.score, 0) / trends.length)}/100\n`;
+    sections.push(
+      `\n## Overview\n\n`,
+      `Total trends analyzed: ${trends.length}\n`,
+      `Categories: ${Object.keys(trendsByCategory).join(', ')}\n`,
+      `Average trend score: ${Math.round(trends.reduce((sum, t) => sum + t.score, 0) / trends.length)}/100\n`
+    );
     
-    return summary;
+    return sections.join('');
   }
 }
 
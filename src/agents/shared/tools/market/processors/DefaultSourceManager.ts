@@ -34,6 +34,7 @@ export class DefaultSourceManager implements ISourceManager {
   private sources: MarketSource[] = [];
   private dataDir: string;
   private sourceFiles = ['feeds.json', 'reddit.json', 'twitter.json'];
+  private sourceFileCache: Map<string, { data: SourceFile; mtimeMs: number }> = new Map();
   
   /**
    * Create a new DefaultSourceManager
@@ -55,7 +56,7 @@ export class DefaultSourceManager implements ISourceManager {
       for (const file of this.sourceFiles) {
         const filePath = path.join(this.dataDir, file);
         if (fs.existsSync(filePath)) {
-          const data = JSON.parse(fs.readFileSync(filePath, 'utf8')) as SourceFile;
+          const data = this.readSourceFile(filePath);
           this.sources.push(...data.sources);
         }
       }
@@ -68,6 +69,39 @@ export class DefaultSourceManager implements ISourceManager {
     }
   }
   
+  /**
+   * Read a source file, reusing the parsed contents while its mtime is unchanged
+   * 
+   * @param filePath Path of the source file
+   */
+  private readSourceFile(filePath: string): SourceFile {
+    const { mtimeMs } = fs.statSync(filePath);
+    const cached = this.sourceFileCache.get(filePath);
+    if (cached && cached.mtimeMs === mtimeMs) {
+      return cached.data;
+    }
+    
+    const data = JSON.parse(fs.readFileSync(filePath, 'utf8')) as SourceFile;
+    this.sourceFileCache.set(filePath, { data, mtimeMs });
+    return data;
+  }
+  
+  /**
+   * Write a source file and refresh its cached contents
+   * 
+   * @param filePath Path of the source file
+   * @param data Contents to write
+   */
+  private writeSourceFile(filePath: string, data: SourceFile): void {
+    try {
+      fs.writeFileSync(filePath, JSON.stringify(data, null, 2));
+    } catch (error) {
+      this.sourceFileCache.delete(filePath);
+      throw error;
+    }
+    this.sourceFileCache.set(filePath, { data, mtimeMs: fs.statSync(filePath).mtimeMs });
+  }
+  
   /**
    * Add a new source
    * 
@@ -99,7 +133,7 @@ export class DefaultSourceManager implements ISourceManager {
       }
       
       // Read existing file
-      const data = JSON.parse(fs.readFileSync(filePath, 'utf8')) as SourceFile;
+      const data = this.readSourceFile(filePath);
       
       // Check if source with same ID already exists
       if (data.sources.some(s => s.id === source.id)) {
@@ -110,7 +144,7 @@ export class DefaultSourceManager implements ISourceManager {
       data.sources.push(source);
       
       // Write back to file
-      fs.writeFileSync(filePath, JSON.stringify(data, null, 2));
+      this.writeSourceFile(filePath, data);
       
       // Update in-memory sources
       this.sources.push(source);
@@ -160,13 +194,13 @@ export class DefaultSourceManager implements ISourceManager {
         return false;
       }
       
-      const data = JSON.parse(fs.readFileSync(filePath, 'utf8')) as SourceFile;
+      const data = this.readSourceFile(filePath);
       
       // Remove the source
       data.sources = data.sources.filter(s => s.id !== sourceId);
       
       // Write back to file
-      fs.writeFileSync(filePath, JSON.stringify(data, null, 2));
+      this.writeSourceFile(filePath, data);
       
       // Update in-memory sources
       this.sources.splice(sourceIndex, 1);
@@ -218,7 +252,7 @@ export class DefaultSourceManager implements ISourceManager {
         throw new SourceManagerError(`Source file ${targetFile} not found`);
       }
       
-      const data = JSON.parse(fs.readFileSync(filePath, 'utf8')) as SourceFile;
+      const data = this.readSourceFile(filePath);
       
       // Find source in file
       const fileSourceIndex = data.sources.findIndex(s => s.id === sourceId);
@@ -236,7 +270,7 @@ export class DefaultSourceManager implements ISourceManager {
       data.sources[fileSourceIndex] = updatedSource;
       
       // Write back to file
-      fs.writeFileSync(filePath, JSON.stringify(data, null, 2));
+      this.writeSourceFile(filePath, data);
       
       // Update in-memory sources
       this.sources[sourceIndex] = updatedSource;
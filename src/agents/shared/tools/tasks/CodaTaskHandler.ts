@@ -12,6 +12,25 @@ import { logger } from '../../../../lib/logging';
 import { codaIntegration } from '../integrations/coda';
 import { createDefaultCodaConfig, CODA_ENV_VARS } from '../config/CodaToolsConfigSchema';
 
+// Patterns that indicate document creation intent
+const DOCUMENT_CREATION_PATTERNS: ReadonlyArray<RegExp> = [
+  /create\s+(?:a\s+)?document\s+(?:about|on|for)\s+(.+)/i,
+  /make\s+(?:a\s+)?document\s+(?:about|on|for)\s+(.+)/i,
+  /write\s+(?:a\s+)?document\s+(?:about|on|for)\s+(.+)/i,
+  /document\s+(.+)/i,
+  /create\s+(?:a\s+)?(?:report|analysis|notes?)\s+(?:about|on|for)\s+(.+)/i,
+  /generate\s+(?:a\s+)?document\s+(?:about|on|for)\s+(.+)/i
+];
+
+// Document type patterns, checked in order
+const DOCUMENT_TYPE_PATTERNS: ReadonlyArray<[NonNullable<CodaDocumentTaskParams['documentType']>, RegExp]> = [
+  ['report', /\b(?:report|summary|overview)\b/i],
+  ['analysis', /\b(?:analysis|analyze|study|research)\b/i],
+  ['meeting-notes', /\b(?:meeting|notes|minutes)\b/i],
+  ['project', /\b(?:project|plan|roadmap)\b/i],
+  ['research', /\b(?:research|investigation|findings)\b/i]
+];
+
 /**
  * Parameters for Coda document creation tasks
  */
@@ -99,6 +118,8 @@ export class CodaTaskHandler {
       // Determine priority (0-10 scale)
       const priority = this.mapPriorityToNumber(params.priority || 'normal');
       
+      const now = new Date();
+
       // Create the task
       const task: Task = {
         id: IdGenerator.generate('task').toString(),
@@ -111,10 +132,10 @@ export class CodaTaskHandler {
         handlerArgs: [],
         status: TaskStatus.PENDING,
         priority,
-        scheduledTime: new Date(), // Execute immediately
+        scheduledTime: now, // Execute immediately
         dependencies: [],
-        createdAt: new Date(),
-        updatedAt: new Date(),
+        createdAt: now,
+        updatedAt: now,
         metadata: {
           tags: ['coda', 'document-creation', ...(params.tags || [])],
           type: 'coda_document_creation',
@@ -240,30 +261,11 @@ export class CodaTaskHandler {
   } {
     const normalizedIntent = intent.toLowerCase().trim();
     
-    // Define patterns that indicate document creation intent
-    const documentCreationPatterns = [
-      /create\s+(?:a\s+)?document\s+(?:about|on|for)\s+(.+)/i,
-      /make\s+(?:a\s+)?document\s+(?:about|on|for)\s+(.+)/i,
-      /write\s+(?:a\s+)?document\s+(?:about|on|for)\s+(.+)/i,
-      /document\s+(.+)/i,
-      /create\s+(?:a\s+)?(?:report|analysis|notes?)\s+(?:about|on|for)\s+(.+)/i,
-      /generate\s+(?:a\s+)?document\s+(?:about|on|for)\s+(.+)/i
-    ];
-    
-    // Document type patterns
-    const documentTypePatterns = {
-      'report': /\b(?:report|summary|overview)\b/i,
-      'analysis': /\b(?:analysis|analyze|study|research)\b/i,
-      'meeting-notes': /\b(?:meeting|notes|minutes)\b/i,
-      'project': /\b(?:project|plan|roadmap)\b/i,
-      'research': /\b(?:research|investigation|findings)\b/i
-    };
-    
     let bestMatch: RegExpMatchArray | null = null;
     let confidence = 0;
     
     // Check for document creation patterns
-    for (const pattern of documentCreationPatterns) {
+    for (const pattern of DOCUMENT_CREATION_PATTERNS) {
       const match = normalizedIntent.match(pattern);
       if (match) {
         bestMatch = match;
@@ -288,7 +290,7 @@ export class CodaTaskHandler {
       title: this.generateTitleFromTopic(topic),
       content: this.generateContentFromTopic(topic),
       autoTitle: false, // We're providing a title
-      documentType: this.detectDocumentType(normalizedIntent, documentTypePatterns),
+      documentType: this.detectDocumentType(normalizedIntent, DOCUMENT_TYPE_PATTERNS),
       tags: this.extractTags(topic)
     };
     
@@ -419,11 +421,11 @@ This document covers ${topic.toLowerCase()}.
    */
   private detectDocumentType(
     intent: string,
-    patterns: Record<string, RegExp>
+    patterns: ReadonlyArray<[NonNullable<CodaDocumentTaskParams['documentType']>, RegExp]>
   ): CodaDocumentTaskParams['documentType'] {
-    for (const [type, pattern] of Object.entries(patterns)) {
+    for (const [type, pattern] of patterns) {
       if (pattern.test(intent)) {
-        return type as CodaDocumentTaskParams['documentType'];
+        return type;
       }
     }
     return 'general';
@@ -67,39 +67,39 @@ export function convertMarkdownTablesToCodaFormat(content: string): string {
     ).filter(row => row.length > 0);
     
     // Try HTML table first (Coda might support this better)
-    let result = '\n<table border="1" style="border-collapse: collapse; width: 100%; margin: 10px 0;">\n';
+    const parts: string[] = ['\n<table border="1" style="border-collapse: collapse; width: 100%; margin: 10px 0;">\n'];
     
     // Add headers
-    result += '  <thead>\n    <tr>\n';
+    parts.push('  <thead>\n    <tr>\n');
     headers.forEach(header => {
-      result += `      <th style="padding: 8px; background-color: #f5f5f5; font-weight: bold; text-align: left;">${header}</th>\n`;
+      parts.push(`      <th style="padding: 8px; background-color: #f5f5f5; font-weight: bold; text-align: left;">${header}</th>\n`);
     });
-    result += '    </tr>\n  </thead>\n';
+    parts.push('    </tr>\n  </thead>\n');
     
     // Add rows
-    result += '  <tbody>\n';
+    parts.push('  <tbody>\n');
     rows.forEach(row => {
-      result += '    <tr>\n';
+      parts.push('    <tr>\n');
       row.forEach(cell => {
-        result += `      <td style="padding: 8px; border-bottom: 1px solid #ddd;">${cell}</td>\n`;
+        parts.push(`      <td style="padding: 8px; border-bottom: 1px solid #ddd;">${cell}</td>\n`);
       });
-      result += '    </tr>\n';
+      parts.push('    </tr>\n');
     });
-    result += '  </tbody>\n</table>\n\n';
+    parts.push('  </tbody>\n</table>\n\n');
     
     // Also add a fallback structured format (most reliable in Coda)
-    result += '**Alternative Format:**\n';
+    parts.push('**Alternative Format:**\n');
     rows.forEach((row, rowIndex) => {
-      result += `\n• **${headers[0] || 'Item'} ${row[0] || (rowIndex + 1)}:**\n`;
+      parts.push(`\n• **${headers[0] || 'Item'} ${row[0] || (rowIndex + 1)}:**\n`);
       row.forEach((cell, cellIndex) => {
         if (cellIndex < headers.length) {
-          result += `  - **${headers[cellIndex]}:** ${cell}\n`;
+          parts.push(`  - **${headers[cellIndex]}:** ${cell}\n`);
         }
       });
     });
-    result += '\n';
+    parts.push('\n');
     
-    return result;
+    return parts.join('');
   });
 }
 
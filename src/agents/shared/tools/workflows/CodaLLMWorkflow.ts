@@ -3,9 +3,23 @@
  * Handles automatic document creation from LLM responses with proper formatting
  */
 
-import { createAllEnhancedCodaTools } from '../implementations/CodaTools';
+import { createEnhancedCodaCreateTool } from '../implementations/CodaTools';
 import { formatContentForCoda, addExportMetadata } from '../utils/CodaFormatting';
 import { logger } from '../../../../lib/logging';
+import { Tool } from '../../../../lib/tools/types';
+
+// Created on first use and shared by every workflow run
+let sharedCreateTool: Tool | null = null;
+
+/**
+ * Get the shared enhanced Coda create tool
+ */
+function getCreateTool(): Tool {
+  if (!sharedCreateTool) {
+    sharedCreateTool = createEnhancedCodaCreateTool();
+  }
+  return sharedCreateTool;
+}
 
 export interface LLMToCodaRequest {
   content: string;
@@ -63,17 +77,14 @@ export async function executeLLMToCodaWorkflow(request: LLMToCodaRequest): Promi
       format
     });
 
-    // Get enhanced Coda tools
-    const enhancedCodaTools = createAllEnhancedCodaTools();
-    const createTool = enhancedCodaTools.find(tool => tool.id === 'enhanced_coda_create');
+    // Get the enhanced Coda create tool
+    const createTool = getCreateTool();
 
-    if (!createTool) {
-      throw new Error('Enhanced Coda create tool not available');
-    }
+    const now = new Date();
 
     // Generate title if needed
     const documentTitle = title || (generateTitle ? generateTitleFromLLMContent(content) : null) || 
-      `${sourceAgent} Response - ${new Date().toLocaleDateString()}`;
+      `${sourceAgent} Response - ${now.toLocaleDateString()}`;
 
     // Format content for Coda using shared utility (includes table conversion)
     const formattedContent = formatContentForCoda(content, {
@@ -86,7 +97,7 @@ export async function executeLLMToCodaWorkflow(request: LLMToCodaRequest): Promi
     const enhancedContent = addExportMetadata(formattedContent, {
       source: `LLM Workflow (${sourceAgent})`,
       generatedBy: sourceAgent,
-      timestamp: new Date().toLocaleString(),
+      timestamp: now.toLocaleString(),
       ...(conversationId && { messageId: conversationId })
     });
 
@@ -142,11 +153,12 @@ export async function executeLLMToCodaWorkflow(request: LLMToCodaRequest): Promi
 function generateTitleFromLLMContent(content: string): string | null {
   if (!content) return null;
 
-  // Look for markdown headers (most common in LLM responses)
-  const headerMatches = content.match(/^#+\s+(.+)$/gm);
-  if (headerMatches && headerMatches.length > 0) {
+  // Look for markdown headers (most common in LLM responses); only the
+  // first one is used, so stop scanning at the first match
+  const headerMatch = content.match(/^#+\s+(.+)$/m);
+  if (headerMatch) {
     // Use first header, clean it up
-    const firstHeader = headerMatches[0].replace(/^#+\s*/, '').trim();
+    const firstHeader = headerMatch[0].replace(/^#+\s*/, '').trim();
     return firstHeader.length > 60 ? firstHeader.substring(0, 57) + '...' : firstHeader;
   }
 
@@ -158,9 +170,9 @@ function generateTitleFromLLMContent(content: string): string | null {
   }
 
   // Extract from first meaningful line
-  const lines = content.split('\n').filter(line => line.trim().length > 0);
-  if (lines.length > 0) {
-    const firstLine = lines[0].trim();
+  const firstMeaningfulLine = content.split('\n').find(line => line.trim().length > 0);
+  if (firstMeaningfulLine) {
+    const firstLine = firstMeaningfulLine.trim();
     
     // Skip common LLM prefixes
     const cleanLine = firstLine
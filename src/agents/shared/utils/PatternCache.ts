@@ -0,0 +1,25 @@
+/**
+ * PatternCache.ts - Caches compiled validation patterns
+ * 
+ * Shared by the input and output processors so a pattern rule's regular
+ * expression is compiled once rather than on every validation pass.
+ */
+
+/**
+ * Cache of compiled regular expressions keyed by pattern source
+ */
+export class PatternCache {
+  private compiledPatterns: Map<string, RegExp> = new Map();
+
+  /**
+   * Get a compiled pattern, compiling each pattern source only once
+   */
+  get(source: string): RegExp {
+    let regex = this.compiledPatterns.get(source);
+    if (!regex) {
+      regex = new RegExp(source);
+      this.compiledPatterns.set(source, regex);
+    }
+    return regex;
+  }
+}
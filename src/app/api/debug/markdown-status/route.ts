@@ -2,6 +2,31 @@ import { NextRequest, NextResponse } from 'next/server';
 import { promises as fs } from 'fs';
 import path from 'path';
 
+/**
+ * Derived values from the status files, keyed by path and reused until the
+ * file's mtime changes so repeated polling skips the read and JSON parse
+ */
+const fileReadCache = new Map<string, { mtimeMs: number; value: unknown }>();
+
+/**
+ * Read a file and derive a value from it, returning the cached value when the
+ * file has not been modified since the last read
+ */
+async function readCached<T>(
+  filePath: string,
+  mtimeMs: number,
+  derive: (content: string) => T
+): Promise<T> {
+  const cached = fileReadCache.get(filePath);
+  if (cached && cached.mtimeMs === mtimeMs) {
+    return cached.value as T;
+  }
+  
+  const value = derive(await fs.readFile(filePath, 'utf8'));
+  fileReadCache.set(filePath, { mtimeMs, value });
+  return value;
+}
+
 /**
  * API endpoint to check markdown loading status
  */
@@ -29,9 +54,9 @@ export async function GET(request: NextRequest) {
       
       // If cache exists, count entries
       if (cacheExists) {
-        const cacheContent = await fs.readFile(CACHE_FILE_PATH, 'utf8');
-        const cacheData = JSON.parse(cacheContent);
-        cacheEntries = Object.keys(cacheData).length;
+        cacheEntries = await readCached(CACHE_FILE_PATH, stats.mtimeMs, content =>
+          Object.keys(JSON.parse(content)).length
+        );
       }
     } catch (error) {
       cacheExists = false;
@@ -48,7 +73,7 @@ export async function GET(request: NextRequest) {
       flagModified = stats.mtime.toISOString();
       
       if (flagExists) {
-        flagContent = await fs.readFile(INIT_FLAG_PATH, 'utf8');
+        flagContent = await readCached(INIT_FLAG_PATH, stats.mtimeMs, content => content);
       }
     } catch (error) {
       flagExists = false;
@@ -5,6 +5,9 @@ import { BaseMetadata } from '../../../../types/metadata';
 
 export const runtime = 'nodejs';
 
+// Maximum number of inputs OpenAI accepts in a single embeddings request
+const EMBEDDING_BATCH_SIZE = 2048;
+
 // Define enhanced metadata schema for transfer operations
 interface TransferMetadata extends BaseMetadata {
   userId?: string;
@@ -40,7 +43,7 @@ export async function POST(request: NextRequest) {
     console.log(`[memory/transfer] Request to transfer memories from ${sourceType} to ${targetType} (limit: ${limit}, dryRun: ${dryRun})`);
     
     // Get memory services
-    const { client, memoryService, searchService } = await getMemoryServices();
+    const { client, memoryService, searchService, embeddingService } = await getMemoryServices();
     
     // Ensure memory service is initialized
     const status = await client.getStatus();
@@ -86,18 +89,47 @@ export async function POST(request: NextRequest) {
     if (!dryRun) {
       console.log(`[memory/transfer] Transferring ${sourceMemories.length} memories to target collection: ${targetType}`);
       
-      for (const memory of sourceMemories) {
+      // One transfer timestamp for the whole batch
+      const transferredAt = new Date().toISOString();
+      
+      // Embed memories in batches instead of one request per memory. Only real
+      // embeddings are reused: if a batch fails (or returns fallback vectors),
+      // addMemory embeds those memories itself, one at a time, as before.
+      const embeddings: Array<number[] | undefined> = new Array(sourceMemories.length);
+      const embeddableIndexes = sourceMemories
+        .map((memory, index) => (memory.text && memory.text.trim() ? index : -1))
+        .filter(index => index !== -1);
+      
+      for (let start = 0; start < embeddableIndexes.length; start += EMBEDDING_BATCH_SIZE) {
+        const batchIndexes = embeddableIndexes.slice(start, start + EMBEDDING_BATCH_SIZE);
+        const batchResults = await embeddingService
+          .getBatchEmbeddings(batchIndexes.map(index => sourceMemories[index].text))
+          .catch(error => {
+            console.warn('[memory/transfer] Batch embedding failed, embedding memories individually:', error);
+            return [];
+          });
+        
+        batchIndexes.forEach((memoryIndex, position) => {
+          const result = batchResults[position];
+          if (result && !result.usedFallback) {
+            embeddings[memoryIndex] = result.embedding;
+          }
+        });
+      }
+      
+      for (const [index, memory] of sourceMemories.entries()) {
         try {
           // Create new memory in target collection
           const result = await memoryService.addMemory({
             type: targetType,
             content: memory.text,
+            embedding: embeddings[index],
             metadata: {
               ...memory.metadata,
               userId: memory.metadata?.userId || 'gab',
               original_id: memory.id,
               original_type: memory.type,
-              transferred_at: new Date().toISOString()
+              transferred_at: transferredAt
             } as TransferMetadata
           });
           
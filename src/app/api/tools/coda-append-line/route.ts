@@ -18,22 +18,10 @@ export async function POST(request: NextRequest) {
     }
     
     try {
-      // First read the existing document
-      const existingContent = await codaIntegration.readDoc(pageId);
-      
-      if (!existingContent) {
-        return NextResponse.json({ 
-          success: false, 
-          error: "Could not read existing document content" 
-        });
-      }
-      
-      // Append the new line with timestamp
+      // updateDoc writes with Coda's "append" insertion mode, so only the new
+      // line is sent; re-reading the page and resending it would duplicate it
       const timestamp = new Date().toLocaleString();
-      const newContent = `${existingContent}\n\n[${timestamp}] ${line}`;
-      
-      // Update the document with the new content
-      await codaIntegration.updateDoc(pageId, newContent);
+      await codaIntegration.updateDoc(pageId, `[${timestamp}] ${line}`);
       
       return NextResponse.json({ 
         success: true, 
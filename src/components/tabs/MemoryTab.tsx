@@ -11,6 +11,9 @@ import { BaseMetadata } from '../../types/metadata';
 import ReactMarkdown from 'react-markdown';
 import { Toaster } from 'react-hot-toast';
 
+// Timestamps already in Date.toISOString() form, which need no parse/format round trip
+const CANONICAL_ISO_TIMESTAMP = /^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z$/;
+
 // Memory property path constants
 const PROPERTY_PATHS = {
   // Common type paths
@@ -253,6 +256,9 @@ const MemoryTab: React.FC<MemoryTabProps> = ({
       // This helps with directly formatted dates like "5/17/2023, 5:26:15 PM"
       if (memory.timestamp && typeof memory.timestamp === 'string' && 
           (memory.timestamp.includes('/') || memory.timestamp.includes('-'))) {
+        if (CANONICAL_ISO_TIMESTAMP.test(memory.timestamp)) {
+          return memory.timestamp;
+        }
         return new Date(memory.timestamp).toISOString();
       }
       
@@ -273,6 +279,9 @@ const MemoryTab: React.FC<MemoryTabProps> = ({
         }
         // Handle string timestamps, trying to parse as date
         if (typeof memory.payload.timestamp === 'string') {
+          if (CANONICAL_ISO_TIMESTAMP.test(memory.payload.timestamp)) {
+            return memory.payload.timestamp;
+          }
           const parsed = new Date(memory.payload.timestamp);
           if (!isNaN(parsed.getTime())) {
             return parsed.toISOString();
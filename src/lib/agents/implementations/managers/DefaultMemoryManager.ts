@@ -115,6 +115,7 @@ export class DefaultMemoryManager implements MemoryManager {
   public readonly managerType: ManagerType = ManagerType.MEMORY;
   
   protected memories: Map<string, MemoryEntry> = new Map();
+  private lowercaseContent: WeakMap<MemoryEntry, string> = new WeakMap();
   protected pruningTimer: NodeJS.Timeout | null = null;
   protected consolidationTimer: NodeJS.Timeout | null = null;
   protected _config: DefaultMemoryManagerConfig;
@@ -270,17 +271,34 @@ export class DefaultMemoryManager implements MemoryManager {
       throw new MemoryError('Memory manager not initialized', 'NOT_INITIALIZED');
     }
 
-    // Get all memories and sort by creation date
-    const allMemories = Array.from(this.memories.values());
-
-    // Sort by creation date
-    return allMemories
-      .sort((a, b) => {
-        const aDate = new Date(a.metadata.createdAt as string);
-        const bDate = new Date(b.metadata.createdAt as string);
-        return bDate.getTime() - aDate.getTime();
-      })
-      .slice(0, limit);
+    if (limit <= 0) {
+      return [];
+    }
+
+    // Keep only the newest `limit` entries while scanning the store instead of
+    // sorting every memory (and allocating Dates per comparison) to return a few
+    const newest: Array<{ memory: MemoryEntry; time: number }> = [];
+
+    for (const memory of Array.from(this.memories.values())) {
+      const time = Date.parse(memory.metadata.createdAt as string) || 0;
+
+      if (newest.length === limit && time <= newest[newest.length - 1].time) {
+        continue;
+      }
+
+      // Insert after any entries with the same timestamp to keep ordering stable
+      let position = newest.length;
+      while (position > 0 && newest[position - 1].time < time) {
+        position--;
+      }
+      newest.splice(position, 0, { memory, time });
+
+      if (newest.length > limit) {
+        newest.pop();
+      }
+    }
+
+    return newest.map(entry => entry.memory);
   }
 
   /**
@@ -416,56 +434,53 @@ export class DefaultMemoryManager implements MemoryManager {
     // Validate query - normalize empty or undefined queries
     const normalizedQuery = query?.trim() || '';
     
-    // Get all memories
-    const allMemories = Array.from(this.memories.values());
-
-    // Apply search criteria based on query presence
-    let results = allMemories;
-    
-    // Only apply semantic search if we have a non-empty query
-    if (normalizedQuery.length > 0) {
+    // Tokenize the query once per search rather than once per memory
+    const searchTerms = normalizedQuery.length > 0
+      ? normalizedQuery.toLowerCase().split(' ')
+      : [];
+    const { timeRange, metadata, type, minRelevance, limit } = options;
+    const metadataEntries = metadata ? Object.entries(metadata) : [];
+
+    // Apply all criteria in a single pass and stop as soon as the limit is met
+    const results: MemoryEntry[] = [];
+    for (const memory of Array.from(this.memories.values())) {
       // Apply search criteria (simple implementation - would use embeddings in production)
-      results = allMemories.filter(memory => {
-        const content = memory.content.toLowerCase();
-        const searchTerms = normalizedQuery.toLowerCase().split(' ');
-        return searchTerms.every(term => content.includes(term));
-      });
-    }
+      if (searchTerms.length > 0) {
+        const content = this.getLowercaseContent(memory);
+        if (!searchTerms.every(term => content.includes(term))) {
+          continue;
+        }
+      }
 
-    // Apply time range filter if specified
-    if (options.timeRange) {
-      results = results.filter(memory => {
-        const { start, end } = options.timeRange!;
-        return (!start || memory.createdAt >= start) && (!end || memory.createdAt <= end);
-      });
-    }
+      // Apply time range filter if specified
+      if (timeRange) {
+        const { start, end } = timeRange;
+        if ((start && memory.createdAt < start) || (end && memory.createdAt > end)) {
+          continue;
+        }
+      }
 
-    // Apply metadata filter if specified
-    if (options.metadata) {
-      results = results.filter(memory => {
-        return Object.entries(options.metadata!).every(([key, value]) => 
-          memory.metadata[key] === value
-        );
-      });
-    }
+      // Apply metadata filter if specified
+      if (!metadataEntries.every(([key, value]) => memory.metadata[key] === value)) {
+        continue;
+      }
 
-    // Apply type filter if specified
-    if (options.type) {
-      results = results.filter(memory => 
-        memory.metadata.type === options.type
-      );
-    }
+      // Apply type filter if specified
+      if (type && memory.metadata.type !== type) {
+        continue;
+      }
 
-    // Apply minimum relevance filter
-    if (options.minRelevance) {
-      results = results.filter(memory => 
-        (memory.metadata.relevance as number || 0.5) >= options.minRelevance!
-      );
-    }
+      // Apply minimum relevance filter
+      if (minRelevance && (memory.metadata.relevance as number || 0.5) < minRelevance) {
+        continue;
+      }
+
+      results.push(memory);
 
-    // Apply limit
-    if (options.limit) {
-      results = results.slice(0, options.limit);
+      // Apply limit
+      if (limit && results.length >= limit) {
+        break;
+      }
     }
 
     // Log search statistics
@@ -485,6 +500,19 @@ export class DefaultMemoryManager implements MemoryManager {
     return results;
   }
 
+  /**
+   * Get the lowercased content of a memory, computed once per entry.
+   * Updates replace the entry object, so cached values never go stale.
+   */
+  private getLowercaseContent(memory: MemoryEntry): string {
+    let content = this.lowercaseContent.get(memory);
+    if (content === undefined) {
+      content = memory.content.toLowerCase();
+      this.lowercaseContent.set(memory, content);
+    }
+    return content;
+  }
+
   /**
    * Update an existing memory
    */
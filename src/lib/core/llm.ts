@@ -3,6 +3,7 @@
  */
 
 import { ChatOpenAI } from '@langchain/openai';
+import { OpenAI } from 'openai';
 import { config } from "./config";
 import { CHEAP_LLM_MODEL } from "../shared/constants";
 
@@ -88,4 +89,36 @@ export function createChatOpenAI(options: {
     maxTokens: maxTokens,
     apiKey: options.apiKey || process.env.OPENAI_API_KEY,
   });
-} 
\ No newline at end of file
+}
+
+// Shared clients, created on first use so importing a module that needs one
+// has no client construction side effect
+let openAIClient: OpenAI | null = null;
+let thinkingLLM: ChatOpenAI | null = null;
+
+/**
+ * Get the shared OpenAI SDK client
+ */
+export function getOpenAIClient(): OpenAI {
+  if (!openAIClient) {
+    openAIClient = new OpenAI({
+      apiKey: process.env.OPENAI_API_KEY
+    });
+  }
+  return openAIClient;
+}
+
+/**
+ * Get the shared LLM for thinking processing, with a short timeout
+ */
+export function getThinkingLLM(): ChatOpenAI {
+  if (!thinkingLLM) {
+    thinkingLLM = new ChatOpenAI({
+      modelName: CHEAP_LLM_MODEL,
+      temperature: 0.2,
+      maxTokens: process.env.OPENAI_MAX_TOKENS ? parseInt(process.env.OPENAI_MAX_TOKENS, 10) : 32000,
+      timeout: 15000 // 15 second timeout for LLM calls
+    });
+  }
+  return thinkingLLM;
+}
@@ -2,15 +2,11 @@ import { DefaultKnowledgeGraph } from '../../agents/shared/knowledge/DefaultKnow
 import { KnowledgeNodeType, KnowledgeNode } from '../../agents/shared/knowledge/interfaces/KnowledgeGraph.interface';
 import { logger } from '../logging';
 import { KnowledgeBootstrapSource } from './types';
-import { OpenAI } from 'openai';
+import { getOpenAIClient } from '../core/llm';
 import dotenv from 'dotenv';
 
 dotenv.config();
 
-const openai = new OpenAI({
-  apiKey: process.env.OPENAI_API_KEY
-});
-
 /**
  * Base class for bootstrapping a knowledge graph with initial data
  */
@@ -158,7 +154,7 @@ SOURCE CONTENT:
 ${source.content.substring(0, 4000)}
 `;
 
-      const response = await openai.chat.completions.create({
+      const response = await getOpenAIClient().chat.completions.create({
         model: process.env.OPENAI_MODEL_NAME || "gpt-4.1-2025-04-14",
         messages: [
           { role: "system", content: "You are a knowledge extraction system that identifies and extracts key concepts from domain content." },
@@ -207,7 +203,7 @@ SOURCE CONTENT:
 ${source.content.substring(0, 4000)}
 `;
 
-      const response = await openai.chat.completions.create({
+      const response = await getOpenAIClient().chat.completions.create({
         model: process.env.OPENAI_MODEL_NAME || "gpt-4.1-2025-04-14",
         messages: [
           { role: "system", content: "You are a knowledge extraction system that identifies and extracts key principles from domain content." },
@@ -255,7 +251,7 @@ SOURCE CONTENT:
 ${source.content.substring(0, 4000)}
 `;
 
-      const response = await openai.chat.completions.create({
+      const response = await getOpenAIClient().chat.completions.create({
         model: process.env.OPENAI_MODEL_NAME || "gpt-4.1-2025-04-14",
         messages: [
           { role: "system", content: "You are a knowledge extraction system that analyzes and structures frameworks from domain content." },
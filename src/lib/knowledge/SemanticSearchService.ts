@@ -1,14 +1,9 @@
-import { OpenAI } from 'openai';
+import { getOpenAIClient } from '../core/llm';
 import { DefaultKnowledgeGraph } from '../../agents/shared/knowledge/DefaultKnowledgeGraph';
 import { KnowledgeNode, KnowledgeNodeType } from '../../agents/shared/knowledge/interfaces/KnowledgeGraph.interface';
 import { logger } from '../logging';
 import { getMemoryServices } from '../../server/memory/services';
 
-// Initialize OpenAI client
-const openai = new OpenAI({
-  apiKey: process.env.OPENAI_API_KEY
-});
-
 /**
  * Search result with relevance score
  */
@@ -140,7 +135,7 @@ export class SemanticSearchService {
    */
   private async getEmbeddingForText(text: string): Promise<number[] | null> {
     try {
-      const response = await openai.embeddings.create({
+      const response = await getOpenAIClient().embeddings.create({
         model: 'text-embedding-3-small',
         input: text
       });
@@ -162,7 +157,7 @@ export class SemanticSearchService {
     for (let i = 0; i < texts.length; i += 10) {
       const batch = texts.slice(i, i + 10);
       try {
-        const response = await openai.embeddings.create({
+        const response = await getOpenAIClient().embeddings.create({
           model: 'text-embedding-3-small',
           input: batch
         });
@@ -325,7 +320,7 @@ export class SemanticSearchService {
       }).filter(info => info !== '');
       
       // Use OpenAI to augment the query with the relevant information
-      const response = await openai.chat.completions.create({
+      const response = await getOpenAIClient().chat.completions.create({
         model: process.env.OPENAI_MODEL_NAME || "gpt-4.1-2025-04-14",
         messages: [
           {
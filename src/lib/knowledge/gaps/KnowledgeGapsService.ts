@@ -1,4 +1,4 @@
-import { OpenAI } from 'openai';
+import { getOpenAIClient } from '../../core/llm';
 import { DefaultKnowledgeGraph } from '../../../agents/shared/knowledge/DefaultKnowledgeGraph';
 import { SemanticSearchService } from '../SemanticSearchService';
 import { logger } from '../../logging';
@@ -6,11 +6,6 @@ import { v4 as uuidv4 } from 'uuid';
 import path from 'path';
 import fs from 'fs';
 
-// Initialize OpenAI client
-const openai = new OpenAI({
-  apiKey: process.env.OPENAI_API_KEY
-});
-
 /**
  * Represents a knowledge gap identified in conversations
  */
@@ -149,7 +144,7 @@ export class KnowledgeGapsService {
       const maxGaps = options.maxGaps || 3;
 
       // Use OpenAI to identify potential knowledge gaps
-      const response = await openai.chat.completions.create({
+      const response = await getOpenAIClient().chat.completions.create({
         model: process.env.OPENAI_MODEL_NAME || "gpt-4.1-2025-04-14",
         messages: [
           {
@@ -414,7 +409,7 @@ Category: ${gap.category}
 
 Please suggest 3-5 specific learning resources to fill this knowledge gap.`;
 
-      const response = await openai.chat.completions.create({
+      const response = await getOpenAIClient().chat.completions.create({
         model: process.env.OPENAI_MODEL_NAME || "gpt-4.1-2025-04-14",
         messages: [
           { role: "system", content: systemPrompt },
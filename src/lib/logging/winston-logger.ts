@@ -131,6 +131,10 @@ export interface LoggingContext {
 export function createLogger(context: LoggingContext = {}) {
   return {
     debug: (message: string, meta: Record<string, any> = {}) => {
+      // Skip merging metadata when debug output is filtered out
+      if (!defaultLogger.isLevelEnabled(LogLevel.DEBUG)) {
+        return;
+      }
       defaultLogger.debug(message, { ...context, ...meta });
     },
     info: (message: string, meta: Record<string, any> = {}) => {
@@ -151,7 +155,9 @@ export function createLogger(context: LoggingContext = {}) {
     },
     success: (message: string, meta: Record<string, any> = {}) => {
       defaultLogger.log('success', message, { ...context, ...meta });
-    }
+    },
+    // Lets callers skip building costly debug messages that would be discarded
+    isDebugEnabled: (): boolean => defaultLogger.isLevelEnabled(LogLevel.DEBUG)
   };
 }
 
@@ -0,0 +1,108 @@
+/**
+ * Tests for task log persistence in the SelfImprovementMechanism
+ */
+
+import * as os from 'os';
+import * as path from 'path';
+import * as fs from 'fs';
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { SelfImprovementMechanism } from '../self-improvement';
+
+// Mirrors MAX_TASK_LOGS in self-improvement.ts
+const MAX_TASK_LOGS = 1000;
+
+/**
+ * Build a minimal successful task log
+ */
+function createTaskLog(taskId: string) {
+  return {
+    taskId,
+    taskType: 'test',
+    startTime: new Date('2025-01-01T00:00:00Z'),
+    endTime: new Date('2025-01-01T00:00:01Z'),
+    successful: true,
+    executionSteps: [{ step: 'run', duration: 1, success: true, metadata: {} }],
+    memoryIds: []
+  };
+}
+
+describe('SelfImprovementMechanism task logs', () => {
+  let testDir: string;
+  let snapshotPath: string;
+  let journalPath: string;
+
+  /**
+   * Create and initialize a mechanism over the test directory
+   */
+  async function createMechanism(): Promise<SelfImprovementMechanism> {
+    const enhancedMemory = { addMemory: vi.fn().mockResolvedValue(undefined) };
+    const mechanism = new SelfImprovementMechanism(
+      {} as any,
+      enhancedMemory as any,
+      {} as any,
+      { dataDir: testDir, skipInitialReviews: true }
+    );
+    await mechanism.initialize();
+    return mechanism;
+  }
+
+  beforeEach(() => {
+    testDir = fs.mkdtempSync(path.join(os.tmpdir(), 'self-improvement-test-'));
+    snapshotPath = path.join(testDir, 'task_execution_logs.json');
+    journalPath = path.join(testDir, 'task_execution_logs.jsonl');
+  });
+
+  afterEach(() => {
+    fs.rmSync(testDir, { recursive: true, force: true });
+  });
+
+  it('should load logs from an old-format snapshot without a journal', async () => {
+    fs.writeFileSync(snapshotPath, JSON.stringify([createTaskLog('t1'), createTaskLog('t2')], null, 2));
+
+    const mechanism = await createMechanism();
+    const taskLogs = mechanism['taskLogs'];
+
+    expect(taskLogs.map(log => log.taskId)).toEqual(['t1', 't2']);
+    expect(taskLogs[0].startTime).toBeInstanceOf(Date);
+  });
+
+  it('should drop a torn trailing journal line and rewrite the journal', async () => {
+    const validLines = [createTaskLog('t1'), createTaskLog('t2')].map(log => JSON.stringify(log));
+    fs.writeFileSync(journalPath, validLines.map(line => line + '\n').join('') + '{"taskId":"t3","task');
+
+    const mechanism = await createMechanism();
+
+    expect(mechanism['taskLogs'].map(log => log.taskId)).toEqual(['t1', 't2']);
+    expect(mechanism['taskLogJournalEntries']).toBe(2);
+    expect(fs.readFileSync(journalPath, 'utf8')).toBe(validLines.map(line => line + '\n').join(''));
+  });
+
+  it('should compact the journal into the snapshot at MAX_TASK_LOGS entries', async () => {
+    const lines = Array.from({ length: MAX_TASK_LOGS - 1 }, (_, index) => JSON.stringify(createTaskLog(`t${index}`)));
+    fs.writeFileSync(journalPath, lines.map(line => line + '\n').join(''));
+
+    const mechanism = await createMechanism();
+    await mechanism.logTaskExecution(createTaskLog('last'));
+
+    const snapshot = JSON.parse(fs.readFileSync(snapshotPath, 'utf8'));
+    expect(snapshot).toHaveLength(MAX_TASK_LOGS);
+    expect(snapshot[snapshot.length - 1].taskId).toBe('last');
+    expect(fs.readFileSync(journalPath, 'utf8')).toBe('');
+    expect(mechanism['taskLogJournalEntries']).toBe(0);
+  });
+
+  it('should not compact after the stored logs failed to load', async () => {
+    fs.writeFileSync(snapshotPath, '[{"taskId": "t1", ');
+
+    const mechanism = await createMechanism();
+    expect(mechanism['taskLogsLoadFailed']).toBe(true);
+
+    mechanism['taskLogJournalEntries'] = MAX_TASK_LOGS - 1;
+    await mechanism.logTaskExecution(createTaskLog('after-failure'));
+
+    // The unreadable snapshot is left for recovery and the entry stays in the journal
+    expect(fs.readFileSync(snapshotPath, 'utf8')).toBe('[{"taskId": "t1", ');
+    expect(fs.readFileSync(journalPath, 'utf8')).toContain('"after-failure"');
+    expect(mechanism['taskLogJournalEntries']).toBe(MAX_TASK_LOGS);
+  });
+});
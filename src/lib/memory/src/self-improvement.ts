@@ -6,6 +6,9 @@ import { IntegrationLayer } from './integration-layer';
 import { ReviewPeriod } from '../../../constants/review';
 import { MemoryType as StandardMemoryType } from '../../../server/memory/config';
 
+// Maximum number of task logs kept in memory and on disk
+const MAX_TASK_LOGS = 1000;
+
 /**
  * Self-Improvement Mechanism
  * 
@@ -61,6 +64,9 @@ export class SelfImprovementMechanism {
   private dataDir: string;
   private metricsPath: string;
   private taskLogPath: string;
+  private taskLogJournalPath: string;
+  private taskLogJournalEntries: number = 0;
+  private taskLogsLoadFailed: boolean = false;
   private adjustmentsPath: string;
   private isInitialized: boolean = false;
   private performanceHistory: PerformanceMetrics[] = [];
@@ -107,6 +113,7 @@ export class SelfImprovementMechanism {
     this.dataDir = options.dataDir || path.join(process.cwd(), 'data', 'self-improvement');
     this.metricsPath = path.join(this.dataDir, 'performance_metrics.json');
     this.taskLogPath = path.join(this.dataDir, 'task_execution_logs.json');
+    this.taskLogJournalPath = path.join(this.dataDir, 'task_execution_logs.jsonl');
     this.adjustmentsPath = path.join(this.dataDir, 'pattern_adjustments.json');
     
     // Set review schedule
@@ -168,12 +175,12 @@ export class SelfImprovementMechanism {
       this.taskLogs.push(taskLog);
       
       // Trim logs if too many
-      if (this.taskLogs.length > 1000) {
-        this.taskLogs = this.taskLogs.slice(-1000);
+      if (this.taskLogs.length > MAX_TASK_LOGS) {
+        this.taskLogs = this.taskLogs.slice(-MAX_TASK_LOGS);
       }
       
       // Save to disk
-      await this.saveTaskLogs();
+      await this.appendTaskLog(taskLog);
       
       // Store in memory for long-term retention
       await this.enhancedMemory.addMemory(
@@ -423,9 +430,47 @@ export class SelfImprovementMechanism {
    */
   private async loadTaskLogs(): Promise<void> {
     try {
+      let logs: any[] = [];
+      
+      // Snapshot of compacted logs
       if (fs.existsSync(this.taskLogPath)) {
-        const data = fs.readFileSync(this.taskLogPath, 'utf8');
-        const logs = JSON.parse(data);
+        logs = JSON.parse(fs.readFileSync(this.taskLogPath, 'utf8'));
+      }
+      
+      // Logs appended since the last compaction, one JSON object per line
+      this.taskLogJournalEntries = 0;
+      if (fs.existsSync(this.taskLogJournalPath)) {
+        const validLines: string[] = [];
+        let skippedLines = 0;
+        
+        for (const line of fs.readFileSync(this.taskLogJournalPath, 'utf8').split('\n')) {
+          if (!line.trim()) {
+            continue;
+          }
+          try {
+            logs.push(JSON.parse(line));
+            validLines.push(line);
+          } catch {
+            // A torn line left by a crash mid-append
+            skippedLines++;
+          }
+        }
+        this.taskLogJournalEntries = validLines.length;
+        
+        // Rewrite the journal without the bad lines so the next append does
+        // not land on the end of a partial record
+        if (skippedLines > 0) {
+          console.warn(`Skipped ${skippedLines} unreadable task log journal line(s)`);
+          fs.writeFileSync(
+            this.taskLogJournalPath,
+            validLines.map(line => line + '\n').join(''),
+            'utf8'
+          );
+        }
+      }
+      
+      if (logs.length > 0) {
+        logs = logs.slice(-MAX_TASK_LOGS);
         
         // Parse dates
         this.taskLogs = logs.map((log: any) => ({
@@ -443,14 +488,37 @@ export class SelfImprovementMechanism {
         console.log('No task logs found, starting fresh');
         this.taskLogs = [];
       }
+      this.taskLogsLoadFailed = false;
     } catch (error) {
       console.error('Error loading task logs:', error);
       this.taskLogs = [];
+      // Keep appending to the journal, but never compact the incomplete
+      // in-memory logs over the snapshot on disk
+      this.taskLogsLoadFailed = true;
+    }
+  }
+  
+  /**
+   * Append a single task log to the journal instead of rewriting every stored log.
+   * Once the journal holds as many entries as the log limit, it is folded back
+   * into the snapshot so the files stay bounded, unless the stored logs could
+   * not be loaded, in which case compaction would overwrite them.
+   */
+  private async appendTaskLog(taskLog: TaskExecutionLog): Promise<void> {
+    try {
+      fs.appendFileSync(this.taskLogJournalPath, JSON.stringify(taskLog) + '\n', 'utf8');
+      this.taskLogJournalEntries++;
+      
+      if (this.taskLogJournalEntries >= MAX_TASK_LOGS && !this.taskLogsLoadFailed) {
+        await this.saveTaskLogs();
+      }
+    } catch (error) {
+      console.error('Error saving task log:', error);
     }
   }
   
   /**
-   * Save task logs to disk
+   * Save task logs to disk as a snapshot and clear the journal
    */
   private async saveTaskLogs(): Promise<void> {
     try {
@@ -459,6 +527,8 @@ export class SelfImprovementMechanism {
         JSON.stringify(this.taskLogs, null, 2),
         'utf8'
       );
+      fs.writeFileSync(this.taskLogJournalPath, '', 'utf8');
+      this.taskLogJournalEntries = 0;
     } catch (error) {
       console.error('Error saving task logs:', error);
     }
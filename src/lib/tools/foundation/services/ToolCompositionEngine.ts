@@ -717,12 +717,33 @@ export class ToolCompositionEngine {
     let executionOrder = 0;
     const pendingSteps = new Set(steps.map(s => s.stepId));
 
+    // Resolve the dependency graph to step indices once, tracking how many
+    // unmet dependencies each step has, so each wave is found without
+    // rescanning every step and its dependency list
+    const indexById = new Map(steps.map((step, index) => [step.stepId, index]));
+    const unmetDependencies = new Array<number>(steps.length).fill(0);
+    const dependents: number[][] = steps.map(() => []);
+
+    steps.forEach((step, index) => {
+      for (const depId of step.dependsOn) {
+        if (executionState.completedSteps.has(depId)) {
+          continue;
+        }
+        unmetDependencies[index]++;
+        const depIndex = indexById.get(depId);
+        if (depIndex !== undefined) {
+          dependents[depIndex].push(index);
+        }
+      }
+    });
+
+    let readyIndices = steps
+      .map((_, index) => index)
+      .filter(index => unmetDependencies[index] === 0);
+
     while (pendingSteps.size > 0) {
-      // Find steps that can be executed (dependencies met)
-      const executableSteps = steps.filter(step =>
-        pendingSteps.has(step.stepId) &&
-        step.dependsOn.every(depId => executionState.completedSteps.has(depId))
-      );
+      // Steps whose dependencies have all completed, in declaration order
+      const executableSteps = readyIndices.map(index => steps[index]);
 
       if (executableSteps.length === 0) {
         // No more executable steps - check for circular dependencies
@@ -814,10 +835,21 @@ export class ToolCompositionEngine {
       const stepResults = await Promise.all(stepPromises);
       results.push(...stepResults);
 
-      // Remove completed steps from pending
+      // Remove completed steps from pending and release their dependents.
+      // Skipped and failed optional steps never complete, so their dependents stay blocked
+      const nextReady: number[] = [];
       stepResults.forEach(result => {
         pendingSteps.delete(result.stepId);
+
+        if (executionState.completedSteps.has(result.stepId)) {
+          for (const dependentIndex of dependents[indexById.get(result.stepId)!]) {
+            if (--unmetDependencies[dependentIndex] === 0) {
+              nextReady.push(dependentIndex);
+            }
+          }
+        }
       });
+      readyIndices = nextReady.sort((a, b) => a - b);
     }
 
     return results;
@@ -0,0 +1,57 @@
+/**
+ * Embedding Service Cache Tests
+ */
+
+import { describe, it, expect, beforeEach, vi, Mock } from 'vitest';
+import { EmbeddingService } from './embedding-service';
+
+describe('EmbeddingService', () => {
+  let service: EmbeddingService;
+  let mockCreate: Mock;
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    service = new EmbeddingService({ openAIApiKey: 'test-api-key', dimensions: 3 });
+
+    // Replace the OpenAI client so no request leaves the process
+    mockCreate = vi.fn().mockImplementation(async ({ input }: { input: string | string[] }) => ({
+      data: (Array.isArray(input) ? input : [input]).map(() => ({ embedding: [3, 4, 0] }))
+    }));
+    service['openai'] = { embeddings: { create: mockCreate } } as any;
+  });
+
+  describe('caching', () => {
+    it('should share cached embeddings between single and batch calls for the same trimmed text', async () => {
+      const single = await service.getEmbedding('  hello world  ');
+      const batch = await service.getBatchEmbeddings(['hello world', 'hello world\n']);
+
+      expect(mockCreate).toHaveBeenCalledTimes(1);
+      expect(mockCreate).toHaveBeenCalledWith(expect.objectContaining({ input: 'hello world' }));
+      expect(single.embedding).toEqual([0.6, 0.8, 0]);
+      expect(batch.map(result => result.embedding)).toEqual([single.embedding, single.embedding]);
+      expect(batch.every(result => !result.usedFallback)).toBe(true);
+    });
+
+    it('should only send cache misses in a batch call', async () => {
+      await service.getEmbedding('cached');
+      await service.getBatchEmbeddings(['cached', 'fresh']);
+
+      expect(mockCreate).toHaveBeenCalledTimes(2);
+      expect(mockCreate).toHaveBeenLastCalledWith(expect.objectContaining({ input: ['fresh'] }));
+    });
+
+    it('should not cache the fallback for a zero-magnitude embedding', async () => {
+      mockCreate.mockImplementation(async ({ input }: { input: string | string[] }) => ({
+        data: (Array.isArray(input) ? input : [input]).map(() => ({ embedding: [0, 0, 0] }))
+      }));
+
+      const single = await service.getEmbedding('empty vector');
+      const batch = await service.getBatchEmbeddings(['empty vector']);
+
+      expect(single.usedFallback).toBe(true);
+      expect(batch[0].usedFallback).toBe(true);
+      expect(mockCreate).toHaveBeenCalledTimes(2);
+      expect(service['embeddingCache'].size).toBe(0);
+    });
+  });
+});
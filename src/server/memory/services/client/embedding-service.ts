@@ -1,6 +1,7 @@
 /**
  * Service for generating text embeddings
  */
+import { createHash } from 'crypto';
 import { OpenAI } from 'openai';
 import { DEFAULTS, MemoryErrorCode } from '../../config';
 import { handleMemoryError } from '../../utils';
@@ -18,6 +19,11 @@ export interface EmbeddingServiceOptions {
   dimensions?: number;
 }
 
+/**
+ * Maximum number of embeddings kept in the content-hash cache
+ */
+const EMBEDDING_CACHE_SIZE = 2000;
+
 /**
  * Embedding result
  */
@@ -35,6 +41,7 @@ export class EmbeddingService {
   private embeddingModel: string;
   private dimensions: number;
   private useRandomFallback: boolean;
+  private embeddingCache: Map<string, number[]> = new Map();
   
   /**
    * Create a new embedding service
@@ -84,6 +91,16 @@ export class EmbeddingService {
         return this.getRandomEmbedding('OpenAI not initialized');
       }
       
+      // Reuse the embedding of identical text instead of calling the API again
+      const cacheKey = this.getContentHash(normalizedText);
+      const cached = this.embeddingCache.get(cacheKey);
+      if (cached) {
+        return {
+          embedding: cached,
+          model: this.embeddingModel
+        };
+      }
+      
       // Generate embeddings using OpenAI
       const response = await this.openai.embeddings.create({
         model: this.embeddingModel,
@@ -98,6 +115,11 @@ export class EmbeddingService {
         return this.getRandomEmbedding('Invalid embedding received from API');
       }
       
+      // A zero-magnitude vector would normalize to random noise; never cache that
+      if (!this.hasValidMagnitude(embedding)) {
+        return this.getRandomEmbedding('Zero-magnitude embedding received from API');
+      }
+      
       // Update dimensions if needed
       if (embedding.length !== this.dimensions) {
         console.log(`Updating embedding dimensions from ${this.dimensions} to ${embedding.length}`);
@@ -106,6 +128,7 @@ export class EmbeddingService {
       
       // Normalize vector
       const normalizedEmbedding = this.normalizeVector(embedding);
+      this.cacheEmbedding(cacheKey, normalizedEmbedding);
       
       return {
         embedding: normalizedEmbedding,
@@ -134,30 +157,59 @@ export class EmbeddingService {
         return texts.map(() => this.getRandomEmbedding('Batch fallback'));
       }
       
+      // Key the cache on trimmed text, as getEmbedding does, and only send
+      // texts whose embeddings are not already cached
+      const normalizedTexts = texts.map(text => text?.trim() || '');
+      const cacheKeys = normalizedTexts.map(text => this.getContentHash(text));
+      const results: Array<EmbeddingResult | undefined> = normalizedTexts.map((text, index) => {
+        if (text.length === 0) {
+          return this.getEmptyTextEmbedding();
+        }
+        const cached = this.embeddingCache.get(cacheKeys[index]);
+        return cached ? { embedding: cached, model: this.embeddingModel } : undefined;
+      });
+      const missingIndexes = results
+        .map((result, index) => result ? -1 : index)
+        .filter(index => index !== -1);
+      
+      if (missingIndexes.length === 0) {
+        return results as EmbeddingResult[];
+      }
+      
       // Generate embeddings using OpenAI
       const response = await this.openai.embeddings.create({
         model: this.embeddingModel,
-        input: texts,
+        input: missingIndexes.map(index => normalizedTexts[index]),
         encoding_format: 'float'
       });
       
       // Process and validate results
-      return response.data.map(item => {
+      response.data.forEach((item, position) => {
+        const index = missingIndexes[position];
         const embedding = item.embedding;
         
         // Validate embedding
         if (!Array.isArray(embedding) || embedding.length === 0) {
-          return this.getRandomEmbedding('Invalid embedding in batch response');
+          results[index] = this.getRandomEmbedding('Invalid embedding in batch response');
+          return;
+        }
+        
+        if (!this.hasValidMagnitude(embedding)) {
+          results[index] = this.getRandomEmbedding('Zero-magnitude embedding in batch response');
+          return;
         }
         
         // Normalize vector
         const normalizedEmbedding = this.normalizeVector(embedding);
+        this.cacheEmbedding(cacheKeys[index], normalizedEmbedding);
         
-        return {
+        results[index] = {
           embedding: normalizedEmbedding,
           model: this.embeddingModel
         };
       });
+      
+      return results as EmbeddingResult[];
     } catch (error) {
       console.error('Error generating batch embeddings:', error);
       
@@ -171,6 +223,27 @@ export class EmbeddingService {
     }
   }
   
+  /**
+   * Hash text content into a cache key
+   */
+  private getContentHash(text: string): string {
+    return createHash('sha256').update(text).digest('hex');
+  }
+  
+  /**
+   * Store an API embedding, evicting the oldest entry when the cache is full.
+   * Fallback embeddings are never cached.
+   */
+  private cacheEmbedding(key: string, embedding: number[]): void {
+    if (this.embeddingCache.size >= EMBEDDING_CACHE_SIZE) {
+      const oldestKey = this.embeddingCache.keys().next().value;
+      if (oldestKey !== undefined) {
+        this.embeddingCache.delete(oldestKey);
+      }
+    }
+    this.embeddingCache.set(key, embedding);
+  }
+  
   /**
    * Generate a random embedding (fallback)
    */
@@ -192,6 +265,14 @@ export class EmbeddingService {
     };
   }
   
+  /**
+   * Check that a vector has a finite, non-zero magnitude and can be normalized
+   */
+  private hasValidMagnitude(vector: number[]): boolean {
+    const squaredSum = vector.reduce((sum, val) => sum + val * val, 0);
+    return squaredSum > 0 && isFinite(squaredSum);
+  }
+  
   /**
    * Normalize a vector to unit length
    */
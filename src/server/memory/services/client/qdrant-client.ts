@@ -304,15 +304,23 @@ export class QdrantMemoryClient implements IMemoryClient {
         return true;
       }
 
-      // Create collection
+      // Create collection. Scalar int8 quantization keeps a 4x smaller copy of
+      // the vectors in RAM for search; Qdrant rescores against the originals.
       await this.client.createCollection(collectionName, {
         vectors: {
           size: dimensions,
           distance: "Cosine"
+        },
+        quantization_config: {
+          scalar: {
+            type: "int8",
+            quantile: 0.99,
+            always_ram: true
+          }
         }
       });
 
-      // Create indices for timestamp and type
+      // Create indices for timestamp, type and importance
       await this.client.createPayloadIndex(collectionName, {
         field_name: "timestamp",
         field_schema: "datetime"
@@ -323,6 +331,13 @@ export class QdrantMemoryClient implements IMemoryClient {
         field_schema: "keyword"
       });
 
+      // Index importance so importance-filtered searches are planned from the
+      // payload index instead of filtering HNSW candidates after the fact
+      await this.client.createPayloadIndex(collectionName, {
+        field_name: "metadata.importance",
+        field_schema: "keyword"
+      });
+
       this.collections.add(collectionName);
       return true;
     } catch (error) {
@@ -366,7 +381,7 @@ export class QdrantMemoryClient implements IMemoryClient {
 
       // Convert the payload to a standard record format for Qdrant
       // Using type assertion to handle the BaseMemorySchema conversion
-      const recordPayload = { ...(point.payload as unknown as Record<string, unknown>) };
+      const recordPayload = point.payload as unknown as Record<string, unknown>;
 
       // CRITICAL FIX: Convert ULID to UUID for Qdrant compatibility
       const qdrantPointId = this.convertToQdrantId(point.id);
@@ -597,7 +612,8 @@ export class QdrantMemoryClient implements IMemoryClient {
           offset: query.offset || 0,
           filter: query.filter ? this.buildQdrantFilter(query.filter) : undefined,
           with_payload: true,
-          with_vector: true,
+          // Results only carry id, score and payload, so don't transfer and parse vectors
+          with_vector: false,
           score_threshold: query.scoreThreshold
         });
 
@@ -759,6 +775,7 @@ export class QdrantMemoryClient implements IMemoryClient {
           }
 
           // Map points to memory format with type safety
+          const fallbackTimestamp = new Date().toISOString();
           return response.points.map(point => {
             const payload = point.payload as Record<string, any>;
             const memoryPoint: any = {
@@ -767,8 +784,8 @@ export class QdrantMemoryClient implements IMemoryClient {
               payload: payload,
               metadata: payload.metadata || {},
               content: payload.content || '',
-              createdAt: payload.createdAt || new Date().toISOString(),
-              updatedAt: payload.updatedAt || new Date().toISOString(),
+              createdAt: payload.createdAt || fallbackTimestamp,
+              updatedAt: payload.updatedAt || fallbackTimestamp,
             };
 
             // Copy all other payload fields to the root level
@@ -829,6 +846,7 @@ export class QdrantMemoryClient implements IMemoryClient {
       }
 
       // Map points to memory format with proper typing
+      const fallbackTimestamp = new Date().toISOString();
       return response.points.map(point => {
         const payload = point.payload as Record<string, any>;
 
@@ -839,8 +857,8 @@ export class QdrantMemoryClient implements IMemoryClient {
           payload: payload,
           metadata: payload.metadata || {},
           content: payload.content || '',
-          createdAt: payload.createdAt || new Date().toISOString(),
-          updatedAt: payload.updatedAt || new Date().toISOString(),
+          createdAt: payload.createdAt || fallbackTimestamp,
+          updatedAt: payload.updatedAt || fallbackTimestamp,
         };
 
         // Add all other payload fields as additional properties
@@ -908,7 +926,7 @@ export class QdrantMemoryClient implements IMemoryClient {
 
         // Convert the payload to a standard record format for Qdrant
         // Using type assertion to handle the BaseMemorySchema conversion
-        const recordPayload = { ...(updatedPoint.payload as unknown as Record<string, unknown>) };
+        const recordPayload = updatedPoint.payload as unknown as Record<string, unknown>;
 
         // Replace the point - convert ID to UUID for Qdrant
         const qdrantId = this.convertToQdrantId(id);
@@ -930,7 +948,7 @@ export class QdrantMemoryClient implements IMemoryClient {
       if (updates.payload) {
         // Convert the payload to a standard record format for Qdrant
         // Using type assertion to handle the BaseMemorySchema conversion
-        const recordPayload = { ...(updates.payload as unknown as Record<string, unknown>) };
+        const recordPayload = updates.payload as unknown as Record<string, unknown>;
 
         // Convert ID to UUID for Qdrant
         const qdrantId = this.convertToQdrantId(id);
@@ -1050,7 +1068,7 @@ export class QdrantMemoryClient implements IMemoryClient {
       const qdrantPoints = points.map(point => ({
         id: this.convertToQdrantId(point.id),
         vector: point.vector,
-        payload: { ...(point.payload as unknown as Record<string, unknown>) }
+        payload: point.payload as unknown as Record<string, unknown>
       }));
 
       // Batch insert into Qdrant
@@ -1612,6 +1630,7 @@ export class QdrantMemoryClient implements IMemoryClient {
       console.log(`Found ${response.points.length} task points in ${collectionName}`);
 
       // Convert points to the expected format
+      const fallbackTimestamp = new Date().toISOString();
       return response.points.map(point => {
         const payload = point.payload as Record<string, any>;
 
@@ -1626,8 +1645,8 @@ export class QdrantMemoryClient implements IMemoryClient {
           retryAttempts: payload.retryAttempts || 0,
           dependencies: payload.dependencies || [],
           metadata: payload.metadata || {},
-          createdAt: payload.createdAt || new Date().toISOString(),
-          updatedAt: payload.updatedAt || new Date().toISOString()
+          createdAt: payload.createdAt || fallbackTimestamp,
+          updatedAt: payload.updatedAt || fallbackTimestamp
         };
       });
     } catch (error) {
@@ -230,12 +230,15 @@ export class ConversationVisualizationService implements IConversationVisualizat
     const edges: VisualizationEdge[] = [];
     const agentInteractions = new Map<string, Map<string, number>>();
     
+    // Fetch all agent details in one query
+    const agentDetails = await this.getAgentsDetails(normalizedAgentIds);
+    
     // Initialize agent interaction tracking
     for (const agentId of normalizedAgentIds) {
       agentInteractions.set(agentId, new Map<string, number>());
       
       // Add agent node
-      const agent = await this.getAgentDetails(agentId);
+      const agent = agentDetails.get(agentId);
       nodes.push({
         id: agentId,
         type: VisualizationNodeType.AGENT,
@@ -367,8 +370,9 @@ export class ConversationVisualizationService implements IConversationVisualizat
     });
     
     // Add agent nodes and connect to capability
+    const agentDetails = await this.getAgentsDetails(agents);
     for (const agentId of agents) {
-      const agent = await this.getAgentDetails(agentId);
+      const agent = agentDetails.get(agentId);
       const agentNode: VisualizationNode = {
         id: agentId,
         type: VisualizationNodeType.AGENT,
@@ -744,28 +748,35 @@ export class ConversationVisualizationService implements IConversationVisualizat
   }
 
   /**
-   * Get agent details from memory
+   * Get agent details for several agents with a single memory query
+   * Returns a map of agent ID to agent details; agents that are not found are omitted
    */
-  private async getAgentDetails(agentId: string): Promise<any | null> {
+  private async getAgentsDetails(agentIds: string[]): Promise<Map<string, any>> {
+    const details = new Map<string, any>();
+    if (agentIds.length === 0) {
+      return details;
+    }
+    
     try {
-      // Get agent from memory
-      const result = await this.memoryService.searchMemories({
+      const results = await this.memoryService.searchMemories({
         type: 'agent' as unknown as MemoryType,
         filter: {
-          id: agentId
+          id: { $in: agentIds }
         },
-        limit: 1
+        limit: agentIds.length
       });
       
-      if (result && result.length > 0) {
-        return result[0].payload;
+      for (const result of results || []) {
+        const payload = result.payload as Record<string, any>;
+        if (payload?.id !== undefined && !details.has(payload.id)) {
+          details.set(payload.id, payload);
+        }
       }
-      
-      return null;
     } catch (error) {
       console.error(`Error getting agent details: ${error}`);
-      return null;
     }
+    
+    return details;
   }
 
   /**
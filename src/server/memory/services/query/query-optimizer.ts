@@ -166,8 +166,9 @@ export class QueryOptimizer implements IQueryOptimizer {
       let vectorDbFilter: Record<string, unknown>;
       if (params.filters) {
         const qdrantFilter = this.filterBuilder.build(params.filters as FilterConditions<T> | CompositeFilter<T>);
-        // Convert QdrantFilter to Record<string, unknown> safely
-        vectorDbFilter = JSON.parse(JSON.stringify(qdrantFilter)) as Record<string, unknown>;
+        // The builder returns a fresh plain object, so it can be used directly
+        // without a JSON stringify/parse copy
+        vectorDbFilter = qdrantFilter as unknown as Record<string, unknown>;
       } else {
         vectorDbFilter = {};
       }
@@ -137,7 +137,7 @@ describe('QdrantMemoryClient', () => {
       const mockQdrantClient = MockedQdrantClient.mock.results[0].value;
       
       expect(mockQdrantClient.createCollection).toHaveBeenCalledWith('new_collection', expect.anything());
-      expect(mockQdrantClient.createPayloadIndex).toHaveBeenCalledTimes(2); // timestamp and type
+      expect(mockQdrantClient.createPayloadIndex).toHaveBeenCalledTimes(3); // timestamp, type and importance
     });
 
     test('should get collection info for an existing collection', async () => {
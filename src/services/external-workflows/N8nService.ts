@@ -456,7 +456,9 @@ export class N8nService implements IExternalWorkflowService {
     timeoutMs: number
   ): Promise<N8nExecutionResponse> {
     const startTime = Date.now();
-    const pollInterval = 2000; // 2 seconds
+    // Poll quickly at first so short executions return promptly, then back off
+    const maxPollInterval = 2000; // 2 seconds
+    let pollInterval = 250;
 
     while (Date.now() - startTime < timeoutMs) {
       try {
@@ -469,6 +471,7 @@ export class N8nService implements IExternalWorkflowService {
 
         // Wait before next poll
         await new Promise(resolve => setTimeout(resolve, pollInterval));
+        pollInterval = Math.min(pollInterval * 2, maxPollInterval);
       } catch (error) {
         // If we can't get status, assume execution failed
         throw new WorkflowExecutionError(
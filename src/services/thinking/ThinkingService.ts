@@ -14,11 +14,9 @@ import { DelegationFeedback } from './delegation/DelegationManager';
 import { CognitiveArtifactService } from './cognitive/CognitiveArtifactService';
 import { getMemoryServices } from '../../server/memory/services';
 import { ImportanceLevel } from '../../constants/memory';
-import { ImportanceCalculatorService } from '../importance/ImportanceCalculatorService';
-import { ImportanceCalculationMode } from '../importance/ImportanceCalculatorService';
-import { MemoryRetriever } from './memory/MemoryRetriever';
+import { ImportanceCalculatorService, ImportanceCalculationMode } from '../importance/ImportanceCalculatorService';
+import { MemoryRetriever, MemoryRetrievalOptions, MemoryRetrievalLogLevel } from './memory/MemoryRetriever';
 import { MemoryFormatter } from './memory/MemoryFormatter';
-import { MemoryRetrievalOptions, MemoryRetrievalLogLevel } from './memory/MemoryRetriever';
 
 /**
  * Implementation of the ThinkingService
@@ -271,12 +271,19 @@ export class SharedMemoryService {
         return [];
       }
       
-      // Filter by tags if provided
+      // Filter by tags if provided, using the tag index instead of scanning each memory's tags
       let filteredMemories = accessibleMemories;
       if (tags && tags.length > 0) {
-        filteredMemories = filteredMemories.filter(memory => 
-          tags.some(tag => memory.tags.includes(tag))
-        );
+        const taggedIds = new Set<string>();
+        for (const tag of tags) {
+          this.tagMemoryIndex.get(tag)?.forEach(id => taggedIds.add(id));
+        }
+        
+        if (taggedIds.size === 0) {
+          return [];
+        }
+        
+        filteredMemories = filteredMemories.filter(memory => taggedIds.has(memory.id));
       }
       
       // Search by content
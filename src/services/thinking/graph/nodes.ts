@@ -1,19 +1,11 @@
 import { HumanMessage, SystemMessage } from '@langchain/core/messages';
-import { ChatOpenAI } from '@langchain/openai';
+import { getThinkingLLM } from '../../../lib/core/llm';
 import { DelegationService } from '../delegation/DelegationService';
 import { FileRetriever } from '../files/FileRetriever';
 import { Entity, ThinkingState } from '../graph/types';
 import { toolService } from '../tools';
 // Note: toolRegistry has been replaced by foundation UnifiedToolRegistry
 
-// Create the LLM model for thinking processing with timeout
-const thinkingLLM = new ChatOpenAI({
-  modelName: process.env.OPENAI_CHEAP_MODEL || "gpt-4.1-nano-2025-04-14",
-  temperature: 0.2,
-  maxTokens: process.env.OPENAI_MAX_TOKENS ? parseInt(process.env.OPENAI_MAX_TOKENS, 10) : 32000,
-  timeout: 15000 // 15 second timeout for LLM calls
-});
-
 // Create the file retriever
 const fileRetriever = new FileRetriever();
 
@@ -141,7 +133,7 @@ Respond in the following JSON format only:
       ];
 
       // @ts-ignore - LangChain types may not be up to date
-      const response = await thinkingLLM.call(messages);
+      const response = await getThinkingLLM().call(messages);
 
       // Parse the response
       const content = response.content.toString();
@@ -220,7 +212,7 @@ Respond in the following JSON format only:
       ];
 
       // @ts-ignore - LangChain types may not be up to date
-      const response = await thinkingLLM.call(messages);
+      const response = await getThinkingLLM().call(messages);
 
       // Parse the response
       const content = response.content.toString();
@@ -323,7 +315,7 @@ Entities: ${state.entities?.map(e => `${e.type}: ${e.value}`).join(', ') || 'Non
       ];
 
       // @ts-ignore - LangChain types may not be up to date
-      const response = await thinkingLLM.call(messages);
+      const response = await getThinkingLLM().call(messages);
 
       // Parse the response
       const content = response.content.toString();
@@ -509,7 +501,7 @@ Available tools:
       ];
 
       // @ts-ignore - LangChain types may not be up to date
-      const response = await thinkingLLM.call(messages);
+      const response = await getThinkingLLM().call(messages);
 
       // Parse the response
       const content = response.content.toString();
@@ -777,7 +769,7 @@ ${state.reasoning?.join('\n') || 'None'}
       ];
 
       // @ts-ignore - LangChain types may not be up to date
-      const response = await thinkingLLM.call(messages);
+      const response = await getThinkingLLM().call(messages);
 
       // Parse the response
       const content = response.content.toString();
@@ -1012,7 +1004,7 @@ Based on this analysis, generate a helpful response to the user's request.
       ];
 
       // @ts-ignore - LangChain types may not be up to date
-      const response = await thinkingLLM.call(messages);
+      const response = await getThinkingLLM().call(messages);
 
       // Extract response text
       const responseText = response.content.toString();
@@ -6,8 +6,7 @@ import { SearchResult } from '../../../../server/memory/services/search/types';
 import { BaseMemorySchema } from '../../../../server/memory/models/base-schema';
 import { MemoryFormatter } from '../../memory/MemoryFormatter';
 import { ContentSummaryGenerator } from '../../../../services/importance/ContentSummaryGenerator';
-import { MemoryRetriever, MemoryRetrievalOptions } from '../../memory/MemoryRetriever';
-import { MemoryRetrievalLogLevel } from '../../memory/MemoryRetriever';
+import { MemoryRetriever, MemoryRetrievalOptions, MemoryRetrievalLogLevel } from '../../memory/MemoryRetriever';
 
 /**
  * Node for retrieving relevant context for the thinking process
@@ -48,6 +48,86 @@ const DEFAULT_OPTIONS: MemoryFormattingOptions = {
   includeImportance: true
 };
 
+/**
+ * Returned when there is nothing to format, shared across calls
+ */
+const NO_MEMORIES_MESSAGE = "No relevant memories available.";
+
+/**
+ * Heading prefixes for each memory type, keyed by WorkingMemoryItem type
+ */
+const MEMORY_HEADING_PREFIXES: Readonly<Record<string, string>> = {
+  fact: '### Fact ',
+  entity: '### Entity ',
+  preference: '### User Preference ',
+  goal: '### Goal ',
+  task: '### Task ',
+  message: '### Previous Message '
+};
+
+/**
+ * Heading prefix for memory types without a dedicated label
+ */
+const DEFAULT_MEMORY_HEADING_PREFIX = '### Memory ';
+
+/**
+ * Render a single memory item as Markdown.
+ * Kept as a pure module-level function so the per-item loop does not go
+ * through instance dispatch and can be reused by other formatters.
+ */
+export function renderMemoryItem(
+  memory: WorkingMemoryItem, 
+  index: number, 
+  options: MemoryFormattingOptions
+): string {
+  let result = "";
+  
+  // Unpack the fields we read once instead of re-probing optional chains
+  const { type, content, tags } = memory;
+  const metadata = memory.metadata;
+  const importanceScore = metadata?.importance_score;
+  
+  // Heading prefixes are resolved once at module load; only the index varies
+  result += `${MEMORY_HEADING_PREFIXES[type] ?? DEFAULT_MEMORY_HEADING_PREFIX}${index}\n`;
+  
+  // For messages, add content summary if available
+  if (type === 'message' && metadata?.contentSummary) {
+    result += `Summary: ${metadata.contentSummary}\n\n`;
+  }
+  
+  result += content;
+  
+  // Include importance information if requested
+  if (options.includeImportance) {
+    let importanceText = '';
+    
+    if (importanceScore !== undefined) {
+      const score = importanceScore;
+      let importanceLevel = 'Low';
+      
+      if (score >= 0.9) importanceLevel = 'Critical';
+      else if (score >= 0.6) importanceLevel = 'High';
+      else if (score >= 0.3) importanceLevel = 'Medium';
+      
+      importanceText = `Importance: ${importanceLevel} (${(score * 100).toFixed(0)}%)`;
+    }
+    else if (metadata?.importance) {
+      importanceText = `Importance: ${metadata.importance}`;
+    }
+    
+    if (importanceText) {
+      result += `\n\n${importanceText}`;
+    }
+  }
+  
+  // Add tags if present and if detailed descriptions are enabled
+  if (options.includeDetailedDescriptions && tags && tags.length > 0) {
+    result += `\nTags: ${tags.join(', ')}`;
+  }
+  
+  return result;
+}
+
 /**
  * Service for formatting memories for LLM context
  */
@@ -60,7 +140,7 @@ export class MemoryFormatter {
     options: MemoryFormattingOptions = DEFAULT_OPTIONS
   ): string {
     if (!memories || memories.length === 0) {
-      return "No relevant memories available.";
+      return NO_MEMORIES_MESSAGE;
     }
     
     // 🚨 ENHANCED: Check for factual information in memories being formatted
@@ -168,7 +248,7 @@ export class MemoryFormatter {
     let result = "# Relevant Context\n\n";
     
     memories.forEach((memory, index) => {
-      result += this.formatSingleMemory(memory, index + 1, options);
+      result += renderMemoryItem(memory, index + 1, options);
       result += "\n\n";
     });
     
@@ -222,7 +302,7 @@ export class MemoryFormatter {
       
       // Format each memory in the group
       sortedMemories.forEach((memory, index) => {
-        result += this.formatSingleMemory(memory, index + 1, options);
+        result += renderMemoryItem(memory, index + 1, options);
         result += "\n\n";
       });
     });
@@ -230,90 +310,6 @@ export class MemoryFormatter {
     return result.trim();
   }
   
-  /**
-   * Format a single memory item
-   */
-  private formatSingleMemory(
-    memory: WorkingMemoryItem, 
-    index: number, 
-    options: MemoryFormattingOptions
-  ): string {
-    let result = "";
-    
-    // Format based on memory type
-    switch (memory.type) {
-      case 'fact':
-        result += `### Fact ${index}\n`;
-        result += memory.content;
-        break;
-        
-      case 'entity':
-        result += `### Entity ${index}\n`;
-        result += memory.content;
-        break;
-        
-      case 'preference':
-        result += `### User Preference ${index}\n`;
-        result += memory.content;
-        break;
-        
-      case 'goal':
-        result += `### Goal ${index}\n`;
-        result += memory.content;
-        break;
-        
-      case 'task':
-        result += `### Task ${index}\n`;
-        result += memory.content;
-        break;
-        
-      case 'message':
-        result += `### Previous Message ${index}\n`;
-        
-        // For messages, add content summary if available
-        if (memory.metadata?.contentSummary) {
-          result += `Summary: ${memory.metadata.contentSummary}\n\n`;
-        }
-        
-        result += memory.content;
-        break;
-        
-      default:
-        result += `### Memory ${index}\n`;
-        result += memory.content;
-    }
-    
-    // Include importance information if requested
-    if (options.includeImportance) {
-      let importanceText = '';
-      
-      if (memory.metadata?.importance_score !== undefined) {
-        const score = memory.metadata.importance_score;
-        let importanceLevel = 'Low';
-        
-        if (score >= 0.9) importanceLevel = 'Critical';
-        else if (score >= 0.6) importanceLevel = 'High';
-        else if (score >= 0.3) importanceLevel = 'Medium';
-        
-        importanceText = `Importance: ${importanceLevel} (${(score * 100).toFixed(0)}%)`;
-      }
-      else if (memory.metadata?.importance) {
-        importanceText = `Importance: ${memory.metadata.importance}`;
-      }
-      
-      if (importanceText) {
-        result += `\n\n${importanceText}`;
-      }
-    }
-    
-    // Add tags if present and if detailed descriptions are enabled
-    if (options.includeDetailedDescriptions && memory.tags && memory.tags.length > 0) {
-      result += `\nTags: ${memory.tags.join(', ')}`;
-    }
-    
-    return result;
-  }
-  
   /**
    * Limit the token count of the formatted output (approximated)
    */
@@ -358,11 +354,13 @@ export class MemoryFormatter {
     files: FileReference[], 
     options: { maxFiles?: number; maxContentLength?: number } = {}
   ): string {
-    if (!files || files.length === 0) {
+    const maxFiles = options.maxFiles ?? 5;
+    
+    // Nothing to render - skip building the header entirely
+    if (!files || files.length === 0 || maxFiles <= 0) {
       return "";
     }
-    
-    const maxFiles = options.maxFiles || 5;
+
     const maxContentLength = options.maxContentLength || 1000;
     
     let result = "# Relevant Files\n\n";
@@ -195,6 +195,11 @@ export class PluginSystem {
    */
   private pluginDirs: string[] = [];
 
+  /**
+   * Parsed plugin manifests keyed by path, reused while the file's mtime is unchanged
+   */
+  private manifestCache: Map<string, { manifest: PluginManifest; mtimeMs: number }> = new Map();
+
   /**
    * Constructor
    * @param toolRegistry Tool registry to register plugin tools with
@@ -233,8 +238,7 @@ export class PluginSystem {
         for (const manifestPath of pluginPaths) {
           try {
             // Load the manifest
-            const manifestContent = await fs.readFile(manifestPath, 'utf-8');
-            const manifest: PluginManifest = JSON.parse(manifestContent);
+            const manifest = await this.readManifest(manifestPath);
 
             // Generate an ID for the plugin
             const pluginId = IdGenerator.generate('plugin').toString();
@@ -256,6 +260,23 @@ export class PluginSystem {
     }
   }
 
+  /**
+   * Read a plugin manifest, only re-reading and re-parsing it when its mtime changes
+   * @param manifestPath Path to the plugin manifest
+   * @returns Parsed manifest
+   */
+  private async readManifest(manifestPath: string): Promise<PluginManifest> {
+    const { mtimeMs } = await fs.stat(manifestPath);
+    const cached = this.manifestCache.get(manifestPath);
+    if (cached && cached.mtimeMs === mtimeMs) {
+      return cached.manifest;
+    }
+
+    const manifest: PluginManifest = JSON.parse(await fs.readFile(manifestPath, 'utf-8'));
+    this.manifestCache.set(manifestPath, { manifest, mtimeMs });
+    return manifest;
+  }
+
   /**
    * Load a plugin from a manifest file
    * @param manifestPath Path to the plugin manifest
@@ -266,8 +287,7 @@ export class PluginSystem {
       console.log(`Loading plugin from ${manifestPath}`);
 
       // Read and parse the manifest
-      const manifestContent = await fs.readFile(manifestPath, 'utf-8');
-      const manifest: PluginManifest = JSON.parse(manifestContent);
+      const manifest = await this.readManifest(manifestPath);
 
       // Generate an ID for the plugin
       const pluginId = IdGenerator.generate('plugin').toString();
@@ -50,6 +50,11 @@ try {
 // Get model from environment or use default
 const CHEAP_MODEL = process.env.OPENAI_CHEAP_MODEL || 'gpt-4.1-nano-2025-04-14';
 
+// Agents keep emitting the same handful of tags, so normalized forms are memoized
+// (bounded, oldest entry evicted first) to skip the regex passes on repeats
+const NORMALIZED_TAG_CACHE_SIZE = 256;
+const normalizedTagCache = new Map<string, string>();
+
 /**
  * Tag extraction result
  */
@@ -251,6 +256,9 @@ export class OpenAITagExtractor {
   private normalizeTag(tagText: string): string {
     if (!tagText || typeof tagText !== 'string') return '';
     
+    const cached = normalizedTagCache.get(tagText);
+    if (cached !== undefined) return cached;
+    
     // Convert to lowercase and trim
     let normalized = tagText.toLowerCase().trim();
     
@@ -277,6 +285,11 @@ export class OpenAITagExtractor {
       }
     }
     
+    if (normalizedTagCache.size >= NORMALIZED_TAG_CACHE_SIZE) {
+      normalizedTagCache.delete(normalizedTagCache.keys().next().value as string);
+    }
+    normalizedTagCache.set(tagText, normalized);
+    
     return normalized;
   }
 